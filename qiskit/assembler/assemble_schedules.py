@@ -14,7 +14,7 @@
 """Assemble function for converting a list of circuits into a qobj."""
 import hashlib
 from collections import defaultdict
-from typing import Any, Dict, List, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from qiskit import qobj, pulse
 from qiskit.assembler.run_config import RunConfig
@@ -221,32 +221,23 @@ def _assemble_instructions(
     qobj_instructions = []
 
     acquire_instruction_map = defaultdict(list)
+    # Assembled waveforms keyed on the id of the pulse they are made from.
+    # The same pulse object is usually played many times, e.g. after compress_pulses.
+    assembled_waveforms = {}
     for time, instruction in sched.instructions:
 
         if isinstance(instruction, instructions.Play):
-            if isinstance(instruction.pulse, library.SymbolicPulse):
-                is_backend_supported = True
-                try:
-                    pulse_shape = ParametricPulseShapes.from_instance(instruction.pulse).name
-                    if pulse_shape not in run_config.parametric_pulses:
-                        is_backend_supported = False
-                except ValueError:
-                    # Custom pulse class, or bare SymbolicPulse object.
-                    is_backend_supported = False
-
-                if not is_backend_supported:
-                    instruction = instructions.Play(
-                        instruction.pulse.get_waveform(), instruction.channel, name=instruction.name
-                    )
-
-            if isinstance(instruction.pulse, library.Waveform):
-                name = hashlib.sha256(instruction.pulse.samples).hexdigest()
+            pulse_id = id(instruction.pulse)
+            if pulse_id not in assembled_waveforms:
+                assembled_waveforms[pulse_id] = _assemble_waveform(instruction.pulse, run_config)
+            waveform = assembled_waveforms[pulse_id]
+            if waveform is not None:
                 instruction = instructions.Play(
-                    library.Waveform(name=name, samples=instruction.pulse.samples),
+                    waveform,
                     channel=instruction.channel,
-                    name=name,
+                    name=waveform.name,
                 )
-                user_pulselib[name] = instruction.pulse.samples
+                user_pulselib[waveform.name] = waveform.samples
 
         # ignore explicit delay instrs on acq channels as they are invalid on IBMQ backends;
         # timing of other instrs will still be shifted appropriately
@@ -276,6 +267,34 @@ def _assemble_instructions(
     return qobj_instructions, max_memory_slot
 
 
+def _assemble_waveform(pulse: library.Pulse, run_config: RunConfig) -> Optional[library.Waveform]:
+    """Convert a played pulse into a waveform named after the hash of its samples.
+
+    Args:
+        pulse: Pulse of a play instruction.
+        run_config: Configuration of the runtime environment.
+
+    Returns:
+        The named waveform to play, or ``None`` when the pulse is played as is,
+        i.e. a symbolic pulse supported by the backend as a parametric pulse.
+    """
+    if isinstance(pulse, library.SymbolicPulse):
+        try:
+            pulse_shape = ParametricPulseShapes.from_instance(pulse).name
+            if pulse_shape in run_config.parametric_pulses:
+                return None
+        except ValueError:
+            # Custom pulse class, or bare SymbolicPulse object.
+            pass
+        pulse = pulse.get_waveform()
+
+    if not isinstance(pulse, library.Waveform):
+        return None
+
+    name = hashlib.sha256(pulse.samples).hexdigest()
+    return library.Waveform(name=name, samples=pulse.samples)
+
+
 def _validate_meas_map(
     instruction_map: Dict[Tuple[int, instructions.Acquire], List[instructions.Acquire]],
     meas_map: List[List[int]],
@@ -343,11 +343,13 @@ def _parse_common_args(
     if isinstance(schedule_los, (LoConfig, dict)):
         schedule_los = [schedule_los]
 
-    # Convert to LoConfig if LO configuration supplied as dictionary
-    schedule_los = [
-        lo_config if isinstance(lo_config, LoConfig) else LoConfig(lo_config)
-        for lo_config in schedule_los
-    ]
+    # Convert to LoConfig if LO configuration supplied as dictionary.
+    # Sweeps often repeat the same dictionary, so each distinct object is converted only once.
+    converted_los = {}
+    for lo_config in schedule_los:
+        if not isinstance(lo_config, LoConfig) and id(lo_config) not in converted_los:
+            converted_los[id(lo_config)] = LoConfig(lo_config)
+    schedule_los = [converted_los.get(id(lo_config), lo_config) for lo_config in schedule_los]
 
     # create run configuration and populate
     run_config_dict = dict(
@@ -16,7 +16,7 @@ from __future__ import annotations
 import logging
 import time
 from abc import abstractmethod, ABC
-from collections.abc import Iterable, Callable, Generator
+from collections.abc import Iterable, Callable, Generator, Iterator
 from typing import Any
 
 from .compilation_status import RunState, PassManagerState, PropertySet
@@ -177,7 +177,7 @@ class BaseController(Task, ABC):
     def iter_tasks(
         self,
         state: PassManagerState,
-    ) -> Generator[Task, PassManagerState, None]:
+    ) -> Generator[Task, PassManagerState, None] | Iterator[Task]:
         """A custom logic to choose a next task to run.
 
         Controller subclass can consume the state to build a proper task pipeline.  The updated
@@ -185,6 +185,9 @@ class BaseController(Task, ABC):
         statements.  This indicates the order of task execution is only determined at running time.
         This method is not allowed to mutate the given state object.
 
+        A controller whose task order doesn't depend on the intermediate state may instead
+        return a plain iterator over the tasks, which avoids the overhead of a generator frame.
+
         Args:
             state: The state of the passmanager workflow at the beginning of this flow controller's
                 execution.
@@ -210,6 +213,16 @@ class BaseController(Task, ABC):
         # Especially, task execution may break when method signature is modified.
 
         task_generator = self.iter_tasks(state)
+        if not isinstance(task_generator, Generator):
+            # Plain iterator doesn't consume the feedback state.
+            for next_task in task_generator:
+                passmanager_ir, state = next_task.execute(
+                    passmanager_ir=passmanager_ir,
+                    state=state,
+                    callback=callback,
+                )
+            return passmanager_ir, state
+
         try:
             next_task = task_generator.send(None)
         except StopIteration:
@@ -67,6 +67,8 @@ class PassManagerState:
     This object is mutable, and might be mutated by pass executions.
     """
 
+    __slots__ = ("workflow_status", "property_set")
+
     workflow_status: WorkflowStatus
     """Status of the current compilation workflow."""
 
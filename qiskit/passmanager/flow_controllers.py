@@ -14,7 +14,7 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Callable, Iterable, Generator
+from collections.abc import Callable, Iterable, Generator, Iterator
 from typing import Type, Any
 
 from qiskit.utils.deprecation import deprecate_func
@@ -25,6 +25,31 @@ from .exceptions import PassManagerError
 logger = logging.getLogger(__name__)
 
 
+def _as_task_tuple(tasks: Task | Iterable[Task]) -> tuple[Task]:
+    """Normalize the controller input into a tuple of tasks.
+
+    Tuples are immutable and thus returned as-is without copy.
+    """
+    if isinstance(tasks, tuple):
+        return tasks
+    if not isinstance(tasks, Iterable):
+        return (tasks,)
+    return tuple(tasks)
+
+
+def _appended_tasks(tasks: tuple[Task], passes: Task | Iterable[Task]) -> tuple[Task]:
+    """Validate new tasks and return a new tuple with them appended to the existing ones.
+
+    Raises:
+        TypeError: When any new task is not a valid pass manager task.
+    """
+    new_tasks = _as_task_tuple(passes)
+    for task in new_tasks:
+        if not isinstance(task, Task):
+            raise TypeError(f"New task {task} is not a valid pass manager pass or flow controller.")
+    return tasks + new_tasks
+
+
 class FlowControllerLinear(BaseController):
     """A standard flow controller that runs tasks one after the other."""
 
@@ -36,9 +61,7 @@ class FlowControllerLinear(BaseController):
     ):
         super().__init__(options)
 
-        if not isinstance(tasks, Iterable):
-            tasks = [tasks]
-        self.tasks: tuple[Task] = tuple(tasks)
+        self.tasks: tuple[Task] = _as_task_tuple(tasks)
 
     @property
     def passes(self) -> list[Task]:
@@ -58,21 +81,10 @@ class FlowControllerLinear(BaseController):
         Args:
             passes: A new task or list of tasks to add.
         """
-        if not isinstance(passes, Iterable):
-            passes = [passes]
-
-        tasks = list(self.tasks)
-        for task in passes:
-            if not isinstance(task, Task):
-                raise TypeError(
-                    f"New task {task} is not a valid pass manager pass or flow controller."
-                )
-            tasks.append(task)
-        self.tasks = tuple(tasks)
+        self.tasks = _appended_tasks(self.tasks, passes)
 
-    def iter_tasks(self, state: PassManagerState) -> Generator[Task, PassManagerState, None]:
-        for task in self.tasks:
-            state = yield task
+    def iter_tasks(self, state: PassManagerState) -> Iterator[Task]:
+        return iter(self.tasks)
 
 
 class DoWhileController(BaseController):
@@ -91,10 +103,9 @@ class DoWhileController(BaseController):
     ):
         super().__init__(options)
 
-        if not isinstance(tasks, Iterable):
-            tasks = [tasks]
-        self.tasks: tuple[Task] = tuple(tasks)
+        self.tasks: tuple[Task] = _as_task_tuple(tasks)
         self.do_while = do_while
+        self._max_iteration: int = self._options.get("max_iteration", 1000)
 
     @property
     def passes(self) -> list[Task]:
@@ -114,28 +125,17 @@ class DoWhileController(BaseController):
         Args:
             passes: A new task or list of tasks to add.
         """
-        if not isinstance(passes, Iterable):
-            passes = [passes]
-
-        tasks = list(self.tasks)
-        for task in passes:
-            if not isinstance(task, Task):
-                raise TypeError(
-                    f"New task {task} is not a valid pass manager pass or flow controller."
-                )
-            tasks.append(task)
-        self.tasks = tuple(tasks)
+        self.tasks = _appended_tasks(self.tasks, passes)
 
     def iter_tasks(self, state: PassManagerState) -> Generator[Task, PassManagerState, None]:
-        max_iteration = self._options.get("max_iteration", 1000)
-        for _ in range(max_iteration):
+        for _ in range(self._max_iteration):
             for task in self.tasks:
                 state = yield task
             if not self.do_while(state.property_set):
                 return
             # Remove stored tasks from the completed task collection for next loop
             state.workflow_status.completed_passes.difference_update(self.tasks)
-        raise PassManagerError("Maximum iteration reached. max_iteration=%i" % max_iteration)
+        raise PassManagerError(f"Maximum iteration reached. max_iteration={self._max_iteration}")
 
 
 class ConditionalController(BaseController):
@@ -151,9 +151,7 @@ class ConditionalController(BaseController):
     ):
         super().__init__(options)
 
-        if not isinstance(tasks, Iterable):
-            tasks = [tasks]
-        self.tasks: tuple[Task] = tuple(tasks)
+        self.tasks: tuple[Task] = _as_task_tuple(tasks)
         self.condition = condition
 
     @property
@@ -174,22 +172,12 @@ class ConditionalController(BaseController):
         Args:
             passes: A new task or list of tasks to add.
         """
-        if not isinstance(passes, Iterable):
-            passes = [passes]
-
-        tasks = list(self.tasks)
-        for task in passes:
-            if not isinstance(task, Task):
-                raise TypeError(
-                    f"New task {task} is not a valid pass manager pass or flow controller."
-                )
-            tasks.append(task)
-        self.tasks = tuple(tasks)
+        self.tasks = _appended_tasks(self.tasks, passes)
 
-    def iter_tasks(self, state: PassManagerState) -> Generator[Task, PassManagerState, None]:
+    def iter_tasks(self, state: PassManagerState) -> Iterator[Task]:
         if self.condition(state.property_set):
-            for task in self.tasks:
-                state = yield task
+            return iter(self.tasks)
+        return iter(())
 
 
 class FlowController(BaseController):
@@ -273,7 +261,7 @@ class FlowController(BaseController):
 
         if controllers:
             # Alias in higher hierarchy becomes outer controller.
-            for alias in cls.hierarchy[::-1]:
+            for alias in reversed(cls.hierarchy):
                 if alias not in controllers:
                     continue
                 class_type = cls.registered_controllers[alias]
@@ -281,7 +269,7 @@ class FlowController(BaseController):
                     "options": options,
                     alias: controllers.pop(alias),
                 }
-                instance = class_type([instance], **init_kwargs)
+                instance = class_type((instance,), **init_kwargs)
 
         return instance
 
@@ -19,8 +19,6 @@ from collections.abc import Callable, Iterable
 from itertools import chain
 from typing import Any
 
-import dill
-
 from qiskit.tools.parallel import parallel_map
 from .base_tasks import Task, PassManagerIR
 from .exceptions import PassManagerError
@@ -232,6 +230,10 @@ class BasePassManager(ABC):
         del callback
         del kwargs
 
+        # dill is only needed to ship the manager to worker processes, so it is not
+        # imported at module load time.
+        import dill
+
         # Pass manager may contain callable and we need to serialize through dill rather than pickle.
         # See https://github.com/Qiskit/qiskit-terra/pull/3290
         # Note that serialized object is deserialized as a different object.
@@ -311,6 +313,8 @@ def _run_workflow_in_new_process(
     Returns:
           Optimized program.
     """
+    import dill
+
     return _run_workflow(
         program=program,
         pass_manager=dill.loads(pass_manager_bin),
@@ -13,6 +13,7 @@
 """Backend Configuration Classes."""
 import re
 import copy
+import functools
 import numbers
 from typing import Dict, List, Any, Iterable, Tuple, Union
 from collections import defaultdict
@@ -28,6 +29,16 @@ from qiskit.pulse.channels import (
 )
 
 
+@functools.lru_cache(maxsize=None)
+def _qubit_channel(channel_type: type, qubit: int) -> Channel:
+    """Return the ``channel_type`` instance for ``qubit``.
+
+    Qubit channels are immutable, so a single instance per type and qubit is shared
+    by all backend configurations.
+    """
+    return channel_type(qubit)
+
+
 class GateConfig:
     """Class representing a Gate Configuration
 
@@ -801,7 +812,7 @@ class PulseBackendConfiguration(QasmBackendConfiguration):
         """
         if not 0 <= qubit < self.n_qubits:
             raise BackendConfigurationError(f"Invalid index for {qubit}-qubit system.")
-        return DriveChannel(qubit)
+        return _qubit_channel(DriveChannel, qubit)
 
     def measure(self, qubit: int) -> MeasureChannel:
         """
@@ -814,7 +825,7 @@ class PulseBackendConfiguration(QasmBackendConfiguration):
         """
         if not 0 <= qubit < self.n_qubits:
             raise BackendConfigurationError(f"Invalid index for {qubit}-qubit system.")
-        return MeasureChannel(qubit)
+        return _qubit_channel(MeasureChannel, qubit)
 
     def acquire(self, qubit: int) -> AcquireChannel:
         """
@@ -827,7 +838,7 @@ class PulseBackendConfiguration(QasmBackendConfiguration):
         """
         if not 0 <= qubit < self.n_qubits:
             raise BackendConfigurationError(f"Invalid index for {qubit}-qubit systems.")
-        return AcquireChannel(qubit)
+        return _qubit_channel(AcquireChannel, qubit)
 
     def control(self, qubits: Iterable[int] = None) -> List[ControlChannel]:
         """
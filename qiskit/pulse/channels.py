@@ -96,6 +96,8 @@ class Channel(metaclass=ABCMeta):
         """
         self._validate_index(index)
         self._index = index
+        # Channels are immutable and heavily used as dictionary keys.
+        self._hash = hash((type(self), index))
 
     @property
     def index(self) -> Union[int, ParameterExpression]:
@@ -155,7 +157,17 @@ class Channel(metaclass=ABCMeta):
         return type(self) is type(other) and self._index == other._index
 
     def __hash__(self):
-        return hash((type(self), self._index))
+        return self._hash
+
+    def __getstate__(self):
+        # Hash of the channel type is not stable across processes.
+        state = self.__dict__.copy()
+        del state["_hash"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._hash = hash((type(self), self._index))
 
 
 class PulseChannel(Channel, metaclass=ABCMeta):
@@ -13,6 +13,8 @@
 """
 Configurations for pulse experiments.
 """
+from __future__ import annotations
+
 from typing import Dict, Union, Tuple, Optional
 import numpy as np
 
@@ -39,17 +41,17 @@ def _assert_nested_dict_equal(a, b):
     return True
 
 
-class Kernel:
-    """Settings for this Kernel, which is responsible for integrating time series (raw) data
-    into IQ points.
+class _DiscriminatorKernelBase:
+    """Common data structure of the settings for readout processing, i.e.
+    :class:`.Kernel` and :class:`.Discriminator`.
     """
 
     def __init__(self, name: Optional[str] = None, **params):
-        """Create new kernel.
+        """Create new setting.
 
         Args:
-            name: Name of kernel to be used
-            params: Any settings for kerneling.
+            name: Name of the setting to be used
+            params: Any settings for the readout processing.
         """
         self.name = name
         self.params = params
@@ -61,34 +63,23 @@ class Kernel:
             ", ".join(f"{str(k)}={str(v)}" for k, v in self.params.items()),
         )
 
+
+class Kernel(_DiscriminatorKernelBase):
+    """Settings for this Kernel, which is responsible for integrating time series (raw) data
+    into IQ points.
+    """
+
     def __eq__(self, other):
         if isinstance(other, Kernel):
             return _assert_nested_dict_equal(self.__dict__, other.__dict__)
         return False
 
 
-class Discriminator:
+class Discriminator(_DiscriminatorKernelBase):
     """Setting for this Discriminator, which is responsible for classifying kerneled IQ points
     into 0/1 state results.
     """
 
-    def __init__(self, name: Optional[str] = None, **params):
-        """Create new discriminator.
-
-        Args:
-            name: Name of discriminator to be used
-            params: Any settings for discrimination.
-        """
-        self.name = name
-        self.params = params
-
-    def __repr__(self):
-        return "{}({}{})".format(
-            self.__class__.__name__,
-            "'" + self.name + "', " or "",
-            ", ".join(f"{str(k)}={str(v)}" for k, v in self.params.items()),
-        )
-
     def __eq__(self, other):
         if isinstance(other, Discriminator):
             return _assert_nested_dict_equal(self.__dict__, other.__dict__)
@@ -98,6 +89,8 @@ class Discriminator:
 class LoRange:
     """Range of LO frequency."""
 
+    __slots__ = ("_lb", "_ub")
+
     def __init__(self, lower_bound: float, upper_bound: float):
         self._lb = lower_bound
         self._ub = upper_bound
@@ -111,9 +104,7 @@ class LoRange:
         Returns:
             bool: True if lo_freq is included in this range, otherwise False
         """
-        if self._lb <= abs(lo_freq) <= self._ub:
-            return True
-        return False
+        return self._lb <= abs(lo_freq) <= self._ub
 
     @property
     def lower_bound(self) -> float:
@@ -142,10 +133,15 @@ class LoRange:
             return True
         return False
 
+    def __hash__(self):
+        return hash((type(self), self._lb, self._ub))
+
 
 class LoConfig:
     """Pulse channel LO frequency container."""
 
+    __slots__ = ("_q_lo_freq", "_m_lo_freq", "_lo_ranges")
+
     def __init__(
         self,
         channel_los: Optional[Dict[PulseChannel, float]] = None,
@@ -207,11 +203,9 @@ class LoConfig:
         Raises:
             PulseError: If freq is outside of channels range
         """
-        lo_ranges = self._lo_ranges
-        if channel in lo_ranges:
-            lo_range = lo_ranges[channel]
-            if not lo_range.includes(freq):
-                raise PulseError(f"Specified LO freq {freq:f} is out of range {lo_range}")
+        lo_range = self._lo_ranges.get(channel, None)
+        if lo_range is not None and not lo_range.includes(freq):
+            raise PulseError(f"Specified LO freq {freq:f} is out of range {lo_range}")
 
     def channel_lo(self, channel: Union[DriveChannel, MeasureChannel]) -> float:
         """Return channel lo.
@@ -224,12 +218,14 @@ class LoConfig:
             Lo of supplied channel if present
         """
         if isinstance(channel, DriveChannel):
-            if channel in self.qubit_los:
-                return self.qubit_los[channel]
+            channel_los = self._q_lo_freq
+        elif isinstance(channel, MeasureChannel):
+            channel_los = self._m_lo_freq
+        else:
+            channel_los = {}
 
-        if isinstance(channel, MeasureChannel):
-            if channel in self.meas_los:
-                return self.meas_los[channel]
+        if channel in channel_los:
+            return channel_los[channel]
 
         raise PulseError("Channel %s is not configured" % channel)
 
@@ -39,6 +39,8 @@ class Acquire(Instruction):
      * the discriminator to classify kerneled IQ points.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         duration: Union[int, ParameterExpression],
@@ -98,7 +100,12 @@ class Acquire(Instruction):
     @property
     def channels(self) -> Tuple[Union[AcquireChannel, MemorySlot, RegisterSlot]]:
         """Returns the channels that this schedule uses."""
-        return tuple(self.operands[ind] for ind in (1, 2, 3) if self.operands[ind] is not None)
+        channel, mem_slot, reg_slot = self._operands[1:4]
+        if reg_slot is None:
+            return (channel,) if mem_slot is None else (channel, mem_slot)
+        if mem_slot is None:
+            return channel, reg_slot
+        return channel, mem_slot, reg_slot
 
     @property
     def duration(self) -> Union[int, ParameterExpression]:
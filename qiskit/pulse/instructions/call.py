@@ -28,6 +28,8 @@ class Call(instruction.Instruction):
     It enables code reuse both within the pulse representation and hardware (if supported).
     """
 
+    __slots__ = ("_arguments", "_assigned_cache")
+
     # Prefix to use for auto naming.
     prefix = "call"
 
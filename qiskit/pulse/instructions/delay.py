@@ -34,6 +34,8 @@ class Delay(Instruction):
         The ``channel`` will output no signal from time=0 up until time=10.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         duration: Union[int, ParameterExpression],
@@ -25,6 +25,8 @@ class Directive(instruction.Instruction, ABC):
     This is a hint to the pulse compiler and is not loaded into hardware.
     """
 
+    __slots__ = ()
+
     @property
     def duration(self) -> int:
         """Duration of this instruction."""
@@ -34,6 +36,8 @@ class Directive(instruction.Instruction, ABC):
 class RelativeBarrier(Directive):
     """Pulse ``RelativeBarrier`` directive."""
 
+    __slots__ = ()
+
     def __init__(self, *channels: chans.Channel, name: Optional[str] = None):
         """Create a relative barrier directive.
 
@@ -101,6 +105,8 @@ class TimeBlockade(Directive):
         user can insert another instruction without timing overlap.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         duration: int,
@@ -35,6 +35,8 @@ class SetFrequency(Instruction):
     The duration of SetFrequency is 0.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         frequency: Union[float, ParameterExpression],
@@ -85,6 +87,8 @@ class SetFrequency(Instruction):
 class ShiftFrequency(Instruction):
     """Shift the channel frequency away from the current frequency."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         frequency: Union[float, ParameterExpression],
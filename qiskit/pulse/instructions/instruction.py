@@ -37,6 +37,8 @@ class Instruction(ABC):
     channels.
     """
 
+    __slots__ = ("_operands", "_name")
+
     def __init__(
         self,
         operands: Tuple,
@@ -31,6 +31,8 @@ class Play(Instruction):
     cycle time, dt, of the backend.
     """
 
+    __slots__ = ()
+
     def __init__(self, pulse: Pulse, channel: PulseChannel, name: Optional[str] = None):
         """Create a new pulse instruction.
 
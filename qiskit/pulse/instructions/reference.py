@@ -35,6 +35,8 @@ class Reference(instruction.Instruction):
     that is supplied at a later time.
     """
 
+    __slots__ = ()
+
     # Delimiter for representing nested scope.
     scope_delimiter = "::"
 
@@ -80,6 +80,20 @@ def triangle(times: np.ndarray, amp: complex, freq: float, phase: float = 0) ->
     )
 
 
+def _angles(times: np.ndarray, freq: float, phase: float) -> np.ndarray:
+    """Return the phase angles ``2 * pi * freq * times + phase`` of a sinusoid.
+
+    The angular frequency is computed once and the phase offset is added in place,
+    so that only a single array is allocated for the angles. Complex input cannot be
+    accumulated in place into a real array, so it is evaluated as written above.
+    """
+    if np.iscomplexobj(times) or np.iscomplexobj(freq) or np.iscomplexobj(phase):
+        return 2 * np.pi * freq * times + phase
+    angles = np.multiply(times, 2 * np.pi * freq, dtype=float)
+    angles += phase
+    return angles
+
+
 def cos(times: np.ndarray, amp: complex, freq: float, phase: float = 0) -> np.ndarray:
     """Continuous cosine wave.
 
@@ -89,7 +103,7 @@ def cos(times: np.ndarray, amp: complex, freq: float, phase: float = 0) -> np.nd
         freq: Pulse frequency, units of 1/dt.
         phase: Pulse phase.
     """
-    return amp * np.cos(2 * np.pi * freq * times + phase).astype(np.complex128)
+    return amp * np.cos(_angles(times, freq, phase)).astype(np.complex128)
 
 
 def sin(times: np.ndarray, amp: complex, freq: float, phase: float = 0) -> np.ndarray:
@@ -101,7 +115,7 @@ def sin(times: np.ndarray, amp: complex, freq: float, phase: float = 0) -> np.nd
         freq: Pulse frequency, units of 1/dt.
         phase: Pulse phase.
     """
-    return amp * np.sin(2 * np.pi * freq * times + phase).astype(np.complex128)
+    return amp * np.sin(_angles(times, freq, phase)).astype(np.complex128)
 
 
 def _fix_gaussian_width(
@@ -173,7 +187,8 @@ def gaussian(
     """
     times = np.asarray(times, dtype=np.complex128)
     x = (times - center) / sigma
-    gauss = amp * np.exp(-(x**2) / 2).astype(np.complex128)
+    # x is already complex, so the exponent needs no extra cast or copy.
+    gauss = amp * np.exp(-0.5 * np.square(x))
 
     if zeroed_width is not None:
         gauss = _fix_gaussian_width(
@@ -17,10 +17,14 @@
 These are pulses which are described by symbolic equations for their envelopes and for their
 parameter constraints.
 """
+import cmath
 import functools
+import threading
 import warnings
-from typing import Any, Dict, List, Optional, Union, Callable, Tuple
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, List, Optional, Union, Callable, Tuple
 from copy import deepcopy
+from operator import attrgetter
 
 import numpy as np
 import symengine as sym
@@ -78,26 +82,173 @@ def _lifted_gaussian(
     return (gauss - offset) / (1 - offset)
 
 
-@functools.lru_cache(maxsize=None)
-def _is_amplitude_valid(envelope_lam: Callable, time: Tuple[float, ...], *fargs: float) -> bool:
-    """A helper function to validate maximum amplitude limit.
+def _sample_times(duration: int) -> np.ndarray:
+    """Return the midpoint sampling times of a pulse with the given duration."""
+    times = np.arange(duration, dtype=float)
+    times += 1 / 2
+    return times
+
+
+def _lifted_gaussian_samples(
+    times: np.ndarray, center: float, t_zero: float, sigma: float
+) -> np.ndarray:
+    """NumPy counterpart of :func:`_lifted_gaussian` evaluated at the given times."""
+    offset = np.exp(-(((t_zero - center) / sigma) ** 2) / 2)
+    gauss = np.exp(-(((times - center) / sigma) ** 2) / 2)
+    return (gauss - offset) / (1 - offset)
+
+
+def _complex_amplitude(amp: complex, angle: float) -> complex:
+    """Return the complex amplitude as a native Python scalar.
+
+    Computing this with the cmath module avoids the NumPy scalar machinery,
+    so that the samples are scaled by a single array operation.
+    """
+    return complex(amp) * cmath.exp(1j * angle)
+
+
+def _centered_gaussian_samples(duration: int, sigma: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Evaluate the lifted Gaussian centered in the pulse, which is zeroed at t = -1, duration + 1.
+
+    The Gaussian is symmetric about the pulse center, as are the midpoint sample times.
+    Thus only the first half of the samples is evaluated, and mirrored to the second half.
+
+    Returns:
+        A tuple of the sample times measured from the pulse center and the Gaussian samples.
+    """
+    center_offsets = _sample_times(duration)
+    center_offsets -= duration / 2
+
+    half = (duration + 1) // 2
+    gauss = np.empty(duration, dtype=float)
+    gauss[:half] = _lifted_gaussian_samples(center_offsets[:half], 0, duration / 2 + 1, sigma)
+    gauss[half:] = gauss[: duration - half][::-1]
+
+    return center_offsets, gauss
+
+
+def _gaussian_samples(duration: int, amp: complex, angle: float, sigma: float) -> np.ndarray:
+    """Evaluate the envelope of :class:`.Gaussian` without the symbolic expression."""
+    _, gauss = _centered_gaussian_samples(duration, sigma)
+    return _complex_amplitude(amp, angle) * gauss
+
 
-    Result is cached for better performance.
+def _constant_samples(duration: int, amp: complex, angle: float) -> np.ndarray:
+    """Evaluate the envelope of :class:`.Constant` without the symbolic expression."""
+    return np.full(duration, _complex_amplitude(amp, angle), dtype=np.complex128)
+
+
+def _drag_samples(
+    duration: int, amp: complex, angle: float, sigma: float, beta: float
+) -> np.ndarray:
+    """Evaluate the envelope of :class:`.Drag` without the symbolic expression."""
+    center_offsets, gauss = _centered_gaussian_samples(duration, sigma)
+    deriv = -center_offsets / (sigma**2) * gauss
+    return _complex_amplitude(amp, angle) * (gauss + 1j * beta * deriv)
+
+
+def _gaussian_square_samples(
+    duration: int, amp: complex, angle: float, sigma: float, width: float
+) -> np.ndarray:
+    """Evaluate the envelope of :class:`.GaussianSquare` without the symbolic expression.
+
+    Both Gaussian edges are lifted by the same offset, so the piecewise envelope is
+    replaced with a single lifted Gaussian of the distance from the flat top,
+    which is clamped to zero within the top.
+    """
+    edge_offsets = _sample_times(duration)
+    edge_offsets -= duration / 2
+    np.abs(edge_offsets, out=edge_offsets)
+    edge_offsets -= width / 2
+    np.maximum(edge_offsets, 0, out=edge_offsets)
+
+    square = _lifted_gaussian_samples(edge_offsets, 0, duration / 2 - width / 2 + 1, sigma)
+    return _complex_amplitude(amp, angle) * square
+
+
+def _is_amplitude_valid(samples: np.ndarray) -> bool:
+    """A helper function to validate maximum amplitude limit.
 
     Args:
-        envelope_lam: The SymbolicPulse's lambdified envelope_lam expression.
-        time: The SymbolicPulse's time array, given as a tuple for hashability.
-        fargs: The arguments for the lambdified envelope_lam, as given by `_get_expression_args`,
-            except for the time array.
+        samples: The SymbolicPulse's envelope samples.
 
     Returns:
         Return True if no sample point exceeds 1.0 in absolute value.
     """
-
-    time = np.asarray(time, dtype=float)
-    samples_norm = np.abs(envelope_lam(time, *fargs))
     epsilon = 1e-7  # The value of epsilon mimics that of Waveform._clip()
-    return np.all(samples_norm < 1.0 + epsilon)
+    return np.max(np.abs(samples), initial=0.0) < 1.0 + epsilon
+
+
+class _EnvelopeSampleCache:
+    """Least recently used cache of envelope samples, bounded by the total number of samples.
+
+    A program usually plays the same calibrated pulse many times, and the parameters of
+    such a pulse are fixed, so the envelope is evaluated only once for all of them.
+
+    The memory held by the cache is bounded by ``max_samples`` stored samples, i.e.
+    ``16 * max_samples`` bytes of complex128 data, plus the keys. Arrays longer than the
+    bound are not stored. The cache is shared by the whole process, so access is
+    serialized with a lock to allow waveforms to be generated from several threads.
+    """
+
+    def __init__(self, max_samples: int):
+        self.max_samples = max_samples
+        self._entries: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+        self._num_samples = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> Optional[np.ndarray]:
+        """Return the samples stored for the key and mark them as recently used."""
+        with self._lock:
+            samples = self._entries.get(key, None)
+            if samples is not None:
+                self._entries.move_to_end(key)
+            return samples
+
+    def put(self, key: tuple, samples: np.ndarray):
+        """Store the samples and evict the least recently used entries beyond the bound."""
+        if samples.size > self.max_samples:
+            return
+        with self._lock:
+            # another thread may have stored the same key in the meantime
+            replaced = self._entries.pop(key, None)
+            if replaced is not None:
+                self._num_samples -= replaced.size
+            self._entries[key] = samples
+            self._num_samples += samples.size
+            while self._num_samples > self.max_samples:
+                _, evicted = self._entries.popitem(last=False)
+                self._num_samples -= evicted.size
+
+
+# Envelope samples of assigned pulses, keyed on the envelope expression and parameter values.
+# The bound of 2**20 samples corresponds to 16 MiB of complex128 data.
+_ENVELOPE_SAMPLES = _EnvelopeSampleCache(max_samples=2**20)
+
+
+@functools.lru_cache(maxsize=1024)
+def _expression_symbols(expr: sym.Expr) -> Tuple[sym.Symbol, ...]:
+    """A helper function to get the argument order of the lambdified expression.
+
+    Collecting and sorting the free symbols traverses the entire expression,
+    so the order is computed only once per expression.
+
+    Args:
+        expr: Symbolic expression to evaluate.
+
+    Returns:
+        Free symbols of the expression sorted by name, except for the time 't' placed at first.
+    """
+    symbols = []
+    for symbol in sorted(expr.free_symbols, key=attrgetter("name")):
+        if symbol.name == "t":
+            # 't' is a special parameter to represent time vector.
+            # This should be place at first to broadcast other parameters
+            # in symengine lambdify function.
+            symbols.insert(0, symbol)
+            continue
+        symbols.append(symbol)
+    return tuple(symbols)
 
 
 def _get_expression_args(expr: sym.Expr, params: Dict[str, float]) -> List[float]:
@@ -114,13 +265,9 @@ def _get_expression_args(expr: sym.Expr, params: Dict[str, float]) -> List[float
         PulseError: When a free symbol value is not defined in the pulse instance parameters.
     """
     args = []
-    for symbol in sorted(expr.free_symbols, key=lambda s: s.name):
+    for symbol in _expression_symbols(expr):
         if symbol.name == "t":
-            # 't' is a special parameter to represent time vector.
-            # This should be place at first to broadcast other parameters
-            # in symengine lambdify function.
-            times = np.arange(0, params["duration"]) + 1 / 2
-            args.insert(0, times)
+            args.append(_sample_times(params["duration"]))
             continue
         try:
             args.append(params[symbol.name])
@@ -132,6 +279,40 @@ def _get_expression_args(expr: sym.Expr, params: Dict[str, float]) -> List[float
     return args
 
 
+def _scalar_lambdify(params: List[sym.Symbol], expr: sym.Expr, fallback: Callable) -> Callable:
+    """A helper function to lambdify an expression that is evaluated with scalar arguments.
+
+    Sympy lambdify with the NumPy module dispatches every operation, for example a logical
+    conjunction, to a NumPy ufunc. This is a large overhead for a scalar evaluation.
+    The math module generates plain Python expressions instead.
+
+    Args:
+        params: Arguments of the lambdified function.
+        expr: Symbolic expression to lambdify.
+        fallback: Lambdified function to call when the expression cannot be evaluated
+            with the math module, e.g. it contains unsupported functions or complex comparisons.
+
+    Returns:
+        Lambdified function.
+    """
+    import sympy
+
+    try:
+        math_func = sympy.lambdify(params, expr, modules="math")
+    except NotImplementedError:
+        # The printer for the math module doesn't support some function in the expression.
+        return fallback
+
+    def _scalar_lamb(*args):
+        try:
+            return math_func(*args)
+        except (NameError, TypeError, ValueError, ArithmeticError):
+            # The math module raises on domain errors and overflows, where NumPy returns nan or inf.
+            return fallback(*args)
+
+    return _scalar_lamb
+
+
 class LambdifiedExpression:
     """Descriptor to lambdify symbolic expression with cache.
 
@@ -147,51 +328,57 @@ class LambdifiedExpression:
     _`Descriptor`: https://docs.python.org/3/reference/datamodel.html#descriptors
     """
 
-    def __init__(self, attribute: str):
+    def __init__(self, attribute: str, maxsize: int = 1024, scalar: bool = False):
         """Create new descriptor.
 
         Args:
             attribute: Name of attribute of :class:`.SymbolicPulse` that returns
                 the target expression to evaluate.
+            maxsize: Maximum number of expressions to keep the callbacks for.
+                The least recently used callback is discarded when this is exceeded.
+            scalar: Set ``True`` when the expression is only evaluated with scalar arguments,
+                such as the parameter constraints. Such expressions are preferably evaluated
+                with the Python math module instead of NumPy.
         """
         self.attribute = attribute
+        self.maxsize = maxsize
+        self.scalar = scalar
+        # Keyed on the expression itself rather than its hash,
+        # so that colliding expressions never share a callback.
         self.lambda_funcs = {}
 
     def __get__(self, instance, owner) -> Callable:
         expr = getattr(instance, self.attribute, None)
         if expr is None:
             raise PulseError(f"'{self.attribute}' of '{instance.pulse_type}' is not assigned.")
-        key = hash(expr)
-        if key not in self.lambda_funcs:
+        if expr not in self.lambda_funcs:
             self.__set__(instance, expr)
+        else:
+            # Move the entry to the end, i.e. mark it as the most recently used.
+            self.lambda_funcs[expr] = self.lambda_funcs.pop(expr)
 
-        return self.lambda_funcs[key]
+        return self.lambda_funcs[expr]
 
     def __set__(self, instance, value):
-        key = hash(value)
-        if key not in self.lambda_funcs:
-            params = []
-            for p in sorted(value.free_symbols, key=lambda s: s.name):
-                if p.name == "t":
-                    # Argument "t" must be placed at first. This is a vector.
-                    params.insert(0, p)
-                    continue
-                params.append(p)
+        if value not in self.lambda_funcs:
+            params = list(_expression_symbols(value))
 
             try:
-                lamb = sym.lambdify(params, [value], real=False)
+                lamb = sym.lambdify(params, [value], real=False, cse=True)
 
                 def _wrapped_lamb(*args):
                     if isinstance(args[0], np.ndarray):
-                        # When the args[0] is a vector ("t"), tile other arguments args[1:]
+                        # When the args[0] is a vector ("t"), broadcast other arguments args[1:]
                         # to prevent evaluation from looping over each element in t.
+                        # The argument matrix is filled in place, so that no intermediate
+                        # arrays are created before the compiled callback is invoked.
+                        # It is allocated with the complex dtype of the callback,
+                        # otherwise the callback converts the entire input once more.
                         t = args[0]
-                        args = np.hstack(
-                            (
-                                t.reshape(t.size, 1),
-                                np.tile(args[1:], t.size).reshape(t.size, len(args) - 1),
-                            )
-                        )
+                        arg_matrix = np.empty((t.size, len(args)), dtype=np.complex128)
+                        arg_matrix[:, 0] = t
+                        arg_matrix[:, 1:] = args[1:]
+                        args = arg_matrix
                     return lamb(args)
 
                 func = _wrapped_lamb
@@ -203,8 +390,12 @@ class LambdifiedExpression:
                 import sympy
 
                 func = sympy.lambdify(params, value)
+                if self.scalar:
+                    func = _scalar_lambdify(params, value, func)
 
-            self.lambda_funcs[key] = func
+            if len(self.lambda_funcs) >= self.maxsize:
+                del self.lambda_funcs[next(iter(self.lambda_funcs))]
+            self.lambda_funcs[value] = func
 
 
 class SymbolicPulse(Pulse):
@@ -397,8 +588,8 @@ class SymbolicPulse(Pulse):
 
     # Lambdify caches keyed on sympy expressions. Returns the corresponding callable.
     _envelope_lam = LambdifiedExpression("_envelope")
-    _constraints_lam = LambdifiedExpression("_constraints")
-    _valid_amp_conditions_lam = LambdifiedExpression("_valid_amp_conditions")
+    _constraints_lam = LambdifiedExpression("_constraints", scalar=True)
+    _valid_amp_conditions_lam = LambdifiedExpression("_valid_amp_conditions", scalar=True)
 
     def __init__(
         self,
@@ -450,10 +641,12 @@ class SymbolicPulse(Pulse):
 
     def __getattr__(self, item):
         # Get pulse parameters with attribute-like access.
-        params = object.__getattribute__(self, "_params")
-        if item not in params:
-            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{item}'")
-        return params[item]
+        try:
+            return object.__getattribute__(self, "_params")[item]
+        except KeyError:
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no attribute '{item}'"
+            ) from None
 
     @property
     def pulse_type(self) -> str:
@@ -499,8 +692,50 @@ class SymbolicPulse(Pulse):
         if self._envelope is None:
             raise PulseError("Pulse envelope expression is not assigned.")
 
-        fargs = _get_expression_args(self._envelope, self.parameters)
-        return Waveform(samples=self._envelope_lam(*fargs), name=self.name)
+        # Waveform may clip the samples in place, so it must not own the cached array.
+        return Waveform(samples=self._envelope_samples().copy(), name=self.name)
+
+    def _envelope_samples(self) -> np.ndarray:
+        """Evaluate the envelope of this pulse, of which parameters are all assigned.
+
+        Samples are shared by pulses with the same envelope and parameter values,
+        so the first evaluation is reused by the amplitude validation and :meth:`get_waveform`.
+
+        Returns:
+            Read-only array of complex envelope samples.
+        """
+        params = self.parameters
+        try:
+            key = (self._envelope, tuple(params.items()))
+            samples = _ENVELOPE_SAMPLES.get(key)
+        except TypeError:
+            # Some parameter value is not hashable.
+            key, samples = None, None
+
+        if samples is None:
+            samples = self._evaluate_envelope(params)
+            samples.setflags(write=False)
+            if key is not None:
+                _ENVELOPE_SAMPLES.put(key, samples)
+
+        return samples
+
+    def _evaluate_envelope(self, params: Dict[str, Any]) -> np.ndarray:
+        """Evaluate the envelope expression with the given parameter values.
+
+        The built-in pulse shapes are evaluated by NumPy directly, as long as the envelope
+        and the parameter names are the ones defined by the library.
+        Otherwise, the lambdified expression is called.
+        """
+        if self._pulse_type in _NUMPY_ENVELOPES:
+            expressions, kernel, kernel_params = _NUMPY_ENVELOPES[self._pulse_type]
+            if params.keys() == kernel_params:
+                library_envelope = expressions()[0]
+                if self._envelope is library_envelope or self._envelope == library_envelope:
+                    return kernel(**params)
+
+        fargs = _get_expression_args(self._envelope, params)
+        return self._envelope_lam(*fargs)
 
     def validate_parameters(self) -> None:
         """Validate parameters.
@@ -530,10 +765,8 @@ class SymbolicPulse(Pulse):
             if check_full_waveform:
                 # Check full waveform only when the condition is satisified or
                 # evaluation condition is not provided.
-                # This operation is slower due to overhead of 'get_waveform'.
-                fargs = _get_expression_args(self._envelope, self.parameters)
-
-                if not _is_amplitude_valid(self._envelope_lam, tuple(fargs.pop(0)), *fargs):
+                # This operation is slower due to overhead of evaluating the envelope.
+                if not _is_amplitude_valid(self._envelope_samples()):
                     param_repr = ", ".join(f"{p}={v}" for p, v in self.parameters.items())
                     raise PulseError(
                         f"Maximum pulse amplitude norm exceeds 1.0 with parameters {param_repr}."
@@ -542,7 +775,11 @@ class SymbolicPulse(Pulse):
 
     def is_parameterized(self) -> bool:
         """Return True iff the instruction is parameterized."""
-        return any(isinstance(val, ParameterExpression) for val in self.parameters.values())
+        # Check the duration and the parameter dict in place rather than through
+        # the merged copy made by ``parameters``.
+        if isinstance(self.duration, ParameterExpression):
+            return True
+        return any(isinstance(val, ParameterExpression) for val in self._params.values())
 
     @property
     def parameters(self) -> Dict[str, Any]:
@@ -729,6 +966,25 @@ class _PulseType(type):
         return NotImplemented
 
 
+@functools.lru_cache(maxsize=None)
+def _gaussian_expressions() -> Tuple[sym.Expr, sym.Expr, sym.Expr]:
+    """Return the envelope, constraints and amplitude conditions of :class:`.Gaussian`.
+
+    The expressions are common to all instances and thus they are built only once.
+    """
+    _t, _duration, _amp, _sigma, _angle = sym.symbols("t, duration, amp, sigma, angle")
+    _center = _duration / 2
+
+    envelope_expr = (
+        _amp * sym.exp(sym.I * _angle) * _lifted_gaussian(_t, _center, _duration + 1, _sigma)
+    )
+
+    consts_expr = _sigma > 0
+    valid_amp_conditions_expr = sym.Abs(_amp) <= 1.0
+
+    return envelope_expr, consts_expr, valid_amp_conditions_expr
+
+
 class Gaussian(metaclass=_PulseType):
     r"""A lifted and truncated pulse envelope shaped according to the Gaussian function whose
     mean is centered at the center of the pulse (duration / 2):
@@ -770,17 +1026,7 @@ class Gaussian(metaclass=_PulseType):
             ScalableSymbolicPulse instance.
         """
         parameters = {"sigma": sigma}
-
-        # Prepare symbolic expressions
-        _t, _duration, _amp, _sigma, _angle = sym.symbols("t, duration, amp, sigma, angle")
-        _center = _duration / 2
-
-        envelope_expr = (
-            _amp * sym.exp(sym.I * _angle) * _lifted_gaussian(_t, _center, _duration + 1, _sigma)
-        )
-
-        consts_expr = _sigma > 0
-        valid_amp_conditions_expr = sym.Abs(_amp) <= 1.0
+        envelope_expr, consts_expr, valid_amp_conditions_expr = _gaussian_expressions()
 
         return ScalableSymbolicPulse(
             pulse_type=cls.alias,
@@ -796,6 +1042,35 @@ class Gaussian(metaclass=_PulseType):
         )
 
 
+@functools.lru_cache(maxsize=None)
+def _gaussian_square_expressions() -> Tuple[sym.Expr, sym.Expr, sym.Expr]:
+    """Return the envelope, constraints and amplitude conditions of :class:`.GaussianSquare`.
+
+    The expressions are common to all instances and thus they are built only once.
+    """
+    _t, _duration, _amp, _sigma, _width, _angle = sym.symbols(
+        "t, duration, amp, sigma, width, angle"
+    )
+    _center = _duration / 2
+
+    _sq_t0 = _center - _width / 2
+    _sq_t1 = _center + _width / 2
+
+    _gaussian_ledge = _lifted_gaussian(_t, _sq_t0, -1, _sigma)
+    _gaussian_redge = _lifted_gaussian(_t, _sq_t1, _duration + 1, _sigma)
+
+    envelope_expr = (
+        _amp
+        * sym.exp(sym.I * _angle)
+        * sym.Piecewise((_gaussian_ledge, _t <= _sq_t0), (_gaussian_redge, _t >= _sq_t1), (1, True))
+    )
+
+    consts_expr = sym.And(_sigma > 0, _width >= 0, _duration >= _width)
+    valid_amp_conditions_expr = sym.Abs(_amp) <= 1.0
+
+    return envelope_expr, consts_expr, valid_amp_conditions_expr
+
+
 class GaussianSquare(metaclass=_PulseType):
     """A square pulse with a Gaussian shaped risefall on both sides lifted such that
     its first sample is zero.
@@ -883,29 +1158,7 @@ class GaussianSquare(metaclass=_PulseType):
             width = duration - 2.0 * risefall_sigma_ratio * sigma
 
         parameters = {"sigma": sigma, "width": width}
-
-        # Prepare symbolic expressions
-        _t, _duration, _amp, _sigma, _width, _angle = sym.symbols(
-            "t, duration, amp, sigma, width, angle"
-        )
-        _center = _duration / 2
-
-        _sq_t0 = _center - _width / 2
-        _sq_t1 = _center + _width / 2
-
-        _gaussian_ledge = _lifted_gaussian(_t, _sq_t0, -1, _sigma)
-        _gaussian_redge = _lifted_gaussian(_t, _sq_t1, _duration + 1, _sigma)
-
-        envelope_expr = (
-            _amp
-            * sym.exp(sym.I * _angle)
-            * sym.Piecewise(
-                (_gaussian_ledge, _t <= _sq_t0), (_gaussian_redge, _t >= _sq_t1), (1, True)
-            )
-        )
-
-        consts_expr = sym.And(_sigma > 0, _width >= 0, _duration >= _width)
-        valid_amp_conditions_expr = sym.Abs(_amp) <= 1.0
+        envelope_expr, consts_expr, valid_amp_conditions_expr = _gaussian_square_expressions()
 
         return ScalableSymbolicPulse(
             pulse_type=cls.alias,
@@ -1329,6 +1582,26 @@ def GaussianDeriv(
     )
 
 
+@functools.lru_cache(maxsize=None)
+def _drag_expressions() -> Tuple[sym.Expr, sym.Expr, sym.Expr]:
+    """Return the envelope, constraints and amplitude conditions of :class:`.Drag`.
+
+    The expressions are common to all instances and thus they are built only once.
+    """
+    _t, _duration, _amp, _sigma, _beta, _angle = sym.symbols("t, duration, amp, sigma, beta, angle")
+    _center = _duration / 2
+
+    _gauss = _lifted_gaussian(_t, _center, _duration + 1, _sigma)
+    _deriv = -(_t - _center) / (_sigma**2) * _gauss
+
+    envelope_expr = _amp * sym.exp(sym.I * _angle) * (_gauss + sym.I * _beta * _deriv)
+
+    consts_expr = _sigma > 0
+    valid_amp_conditions_expr = sym.And(sym.Abs(_amp) <= 1.0, sym.Abs(_beta) < _sigma)
+
+    return envelope_expr, consts_expr, valid_amp_conditions_expr
+
+
 class Drag(metaclass=_PulseType):
     """The Derivative Removal by Adiabatic Gate (DRAG) pulse is a standard Gaussian pulse
     with an additional Gaussian derivative component and lifting applied.
@@ -1397,20 +1670,7 @@ class Drag(metaclass=_PulseType):
             ScalableSymbolicPulse instance.
         """
         parameters = {"sigma": sigma, "beta": beta}
-
-        # Prepare symbolic expressions
-        _t, _duration, _amp, _sigma, _beta, _angle = sym.symbols(
-            "t, duration, amp, sigma, beta, angle"
-        )
-        _center = _duration / 2
-
-        _gauss = _lifted_gaussian(_t, _center, _duration + 1, _sigma)
-        _deriv = -(_t - _center) / (_sigma**2) * _gauss
-
-        envelope_expr = _amp * sym.exp(sym.I * _angle) * (_gauss + sym.I * _beta * _deriv)
-
-        consts_expr = _sigma > 0
-        valid_amp_conditions_expr = sym.And(sym.Abs(_amp) <= 1.0, sym.Abs(_beta) < _sigma)
+        envelope_expr, consts_expr, valid_amp_conditions_expr = _drag_expressions()
 
         return ScalableSymbolicPulse(
             pulse_type="Drag",
@@ -1426,6 +1686,31 @@ class Drag(metaclass=_PulseType):
         )
 
 
+@functools.lru_cache(maxsize=None)
+def _constant_expressions() -> Tuple[sym.Expr, sym.Expr]:
+    """Return the envelope and amplitude conditions of :class:`.Constant`.
+
+    The expressions are common to all instances and thus they are built only once.
+    """
+    _t, _amp, _duration, _angle = sym.symbols("t, amp, duration, angle")
+
+    # Note this is implemented using Piecewise instead of just returning amp
+    # directly because otherwise the expression has no t dependence and sympy's
+    # lambdify will produce a function f that for an array t returns amp
+    # instead of amp * np.ones(t.shape).
+    #
+    # See: https://github.com/sympy/sympy/issues/5642
+    envelope_expr = (
+        _amp
+        * sym.exp(sym.I * _angle)
+        * sym.Piecewise((1, sym.And(_t >= 0, _t <= _duration)), (0, True))
+    )
+
+    valid_amp_conditions_expr = sym.Abs(_amp) <= 1.0
+
+    return envelope_expr, valid_amp_conditions_expr
+
+
 class Constant(metaclass=_PulseType):
     """A simple constant pulse, with an amplitude value and a duration:
 
@@ -1459,22 +1744,7 @@ class Constant(metaclass=_PulseType):
         Returns:
             ScalableSymbolicPulse instance.
         """
-        # Prepare symbolic expressions
-        _t, _amp, _duration, _angle = sym.symbols("t, amp, duration, angle")
-
-        # Note this is implemented using Piecewise instead of just returning amp
-        # directly because otherwise the expression has no t dependence and sympy's
-        # lambdify will produce a function f that for an array t returns amp
-        # instead of amp * np.ones(t.shape).
-        #
-        # See: https://github.com/sympy/sympy/issues/5642
-        envelope_expr = (
-            _amp
-            * sym.exp(sym.I * _angle)
-            * sym.Piecewise((1, sym.And(_t >= 0, _t <= _duration)), (0, True))
-        )
-
-        valid_amp_conditions_expr = sym.Abs(_amp) <= 1.0
+        envelope_expr, valid_amp_conditions_expr = _constant_expressions()
 
         return ScalableSymbolicPulse(
             pulse_type="Constant",
@@ -1959,3 +2229,33 @@ def SechDeriv(
         constraints=consts_expr,
         valid_amp_conditions=valid_amp_conditions_expr,
     )
+
+
+# NumPy evaluation of the built-in pulse envelopes, keyed on the pulse type.
+# Each value is a tuple of the function returning the library expressions of the pulse,
+# of which the first entry is the envelope, the function evaluating the envelope samples
+# with the pulse parameters as keyword arguments, and the names of these parameters.
+_NUMPY_ENVELOPES: Dict[
+    str, Tuple[Callable[[], tuple], Callable[..., np.ndarray], FrozenSet[str]]
+] = {
+    "Gaussian": (
+        _gaussian_expressions,
+        _gaussian_samples,
+        frozenset(("duration", "amp", "angle", "sigma")),
+    ),
+    "GaussianSquare": (
+        _gaussian_square_expressions,
+        _gaussian_square_samples,
+        frozenset(("duration", "amp", "angle", "sigma", "width")),
+    ),
+    "Drag": (
+        _drag_expressions,
+        _drag_samples,
+        frozenset(("duration", "amp", "angle", "sigma", "beta")),
+    ),
+    "Constant": (
+        _constant_expressions,
+        _constant_samples,
+        frozenset(("duration", "amp", "angle")),
+    ),
+}
@@ -44,7 +44,7 @@ class Waveform(Pulse):
         """
 
         super().__init__(duration=len(samples), name=name, limit_amplitude=limit_amplitude)
-        samples = np.asarray(samples, dtype=np.complex128)
+        samples = np.ascontiguousarray(samples, dtype=np.complex128)
         self.epsilon = epsilon
         self._samples = self._clip(samples, epsilon=epsilon)
 
@@ -53,6 +53,22 @@ class Waveform(Pulse):
         """Return sample values."""
         return self._samples
 
+    # Let NumPy defer binary operations, e.g. ``ndarray == waveform``, to the pulse itself
+    # rather than treating the waveform as an array of samples.
+    __array_ufunc__ = None
+
+    def __array__(self, dtype=None, copy=None):
+        """Return the samples as a read-only array, without copying unless it is necessary."""
+        if dtype is not None and np.dtype(dtype) != self._samples.dtype:
+            if copy is False:
+                raise ValueError(f"Waveform samples cannot be converted to {dtype} without a copy.")
+            return self._samples.astype(dtype)
+        if copy:
+            return self._samples.copy()
+        samples = self._samples.view()
+        samples.flags.writeable = False
+        return samples
+
     def _clip(self, samples: np.ndarray, epsilon: float = 1e-7) -> np.ndarray:
         """If samples are within epsilon of unit norm, clip sample by reducing norm by (1-epsilon).
 
@@ -72,6 +88,10 @@ class Waveform(Pulse):
             PulseError: If there exists a pulse sample with a norm greater than 1+epsilon.
         """
         samples_norm = np.abs(samples)
+        if np.max(samples_norm, initial=0.0) <= 1.0:
+            # Nothing to clip or to report, which is the case for most waveforms.
+            return samples
+
         to_clip = (samples_norm > 1.0) & (samples_norm <= 1.0 + epsilon)
 
         if np.any(to_clip):
@@ -114,10 +134,12 @@ class Waveform(Pulse):
         return {}
 
     def __eq__(self, other: Pulse) -> bool:
-        return (
-            super().__eq__(other)
-            and self.samples.shape == other.samples.shape
-            and np.allclose(self.samples, other.samples, rtol=0, atol=self.epsilon)
+        if not super().__eq__(other) or self.samples.shape != other.samples.shape:
+            return False
+        # Identical samples are the common case, e.g. the same calibration on many channels.
+        # Exact comparison is a single reduction, so try it before the tolerance check.
+        return np.array_equal(self.samples, other.samples) or np.allclose(
+            self.samples, other.samples, rtol=0, atol=self.epsilon
         )
 
     def __hash__(self) -> int:
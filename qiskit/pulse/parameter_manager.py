@@ -50,6 +50,7 @@ as the data amount scales.
 Note that we don't need to write any parameter management logic for each object,
 and thus this parameter framework gives greater scalability to the pulse module.
 """
+import functools
 from copy import copy
 from typing import List, Dict, Set, Any, Union
 
@@ -63,6 +64,23 @@ from qiskit.pulse.transforms.alignments import AlignmentKind
 from qiskit.pulse.utils import format_parameter_value
 
 
+@functools.lru_cache(maxsize=None)
+def _visitor_name(visitor_class: type, node_class: type) -> str:
+    """Return the name of the visitor method of ``visitor_class`` for the ``node_class`` node.
+
+    Superclasses of the node are investigated when no dedicated visitor method exists.
+    The result is cached per class pair, because the failed attribute lookups of
+    this search are costly and every insertion into a schedule visits the inserted node.
+    """
+    while node_class != object:
+        name = f"visit_{node_class.__name__}"
+        if hasattr(visitor_class, name):
+            return name
+        # check super class
+        node_class = node_class.__base__
+    return "generic_visit"
+
+
 class NodeVisitor:
     """A node visitor base class that walks instruction data in a pulse program and calls
     visitor functions for every node.
@@ -93,14 +111,7 @@ class NodeVisitor:
 
     def _get_visitor(self, node_class):
         """A helper function to recursively investigate superclass visitor method."""
-        if node_class == object:
-            return self.generic_visit
-
-        try:
-            return getattr(self, f"visit_{node_class.__name__}")
-        except AttributeError:
-            # check super class
-            return self._get_visitor(node_class.__base__)
+        return getattr(self, _visitor_name(type(self), node_class))
 
     def visit_ScheduleBlock(self, node: ScheduleBlock):
         """Visit ``ScheduleBlock``. Recursively visit context blocks and overwrite.
@@ -144,9 +155,9 @@ class ParameterSetter(NodeVisitor):
 
     def visit_Schedule(self, node: Schedule):
         """Visit ``Schedule``. Recursively visit schedule children and overwrite."""
-        # accessing to private member
-        # TODO: consider updating Schedule to handle this more gracefully
-        node._Schedule__children = [(t0, self.visit(sched)) for t0, sched in node.instructions]
+        # Instructions are updated in place, so that the children are kept as is.
+        for _, inst in node.instructions:
+            self.visit(inst)
         node._renew_timeslots()
 
         self._update_parameter_manager(node)
@@ -402,12 +413,13 @@ class ParameterManager:
             return visitor.visit(pulse_program)
         return pulse_program
 
-    def update_parameter_table(self, new_node: Any):
-        """A helper function to update parameter table with given data node.
+    def update_parameter_table(self, *new_nodes: Any):
+        """A helper function to update parameter table with given data nodes.
 
         Args:
-            new_node: A new data node to be added.
+            new_nodes: New data nodes to be added.
         """
         visitor = ParameterGetter()
-        visitor.visit(new_node)
+        for new_node in new_nodes:
+            visitor.visit(new_node)
         self._parameters |= visitor.parameters
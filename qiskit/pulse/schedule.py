@@ -112,6 +112,15 @@ class Schedule:
 
     """
 
+    __slots__ = (
+        "_name",
+        "_parameter_manager",
+        "_metadata",
+        "_duration",
+        "_timeslots",
+        "_children",
+    )
+
     # Prefix to use for auto naming.
     prefix = "sched"
 
@@ -153,7 +162,8 @@ class Schedule:
 
         self._duration = 0
 
-        # These attributes are populated by ``_mutable_insert``
+        # These attributes are populated in bulk rather than by ``_mutable_insert``,
+        # so that the parameter table is updated with a single visitor.
         self._timeslots = {}
         self._children = []
         for sched_pair in schedules:
@@ -162,7 +172,9 @@ class Schedule:
             except TypeError:
                 # recreate as sequence starting at 0.
                 time, sched = 0, sched_pair
-            self._mutable_insert(time, sched)
+            self._add_timeslots(time, sched)
+            self._children.append((time, sched))
+        self._parameter_manager.update_parameter_table(*(sched for _, sched in self._children))
 
     @classmethod
     def initialize_from(cls, other_program: Any, name: Optional[str] = None) -> "Schedule":
@@ -319,8 +331,19 @@ class Schedule:
                 :class:`~qiskit.pulse.Instruction`
                 starts at and the flattened :class:`~qiskit.pulse.Instruction` s.
         """
-        for insert_time, child_sched in self.children:
-            yield from child_sched._instructions(time + insert_time)
+        # Nested schedules are traversed with an explicit stack of child iterators
+        # rather than recursion, because non-inplace insertion nests the original schedule
+        # into the new one and thus builds trees deeper than the recursion limit.
+        stack = [(time, iter(self._children))]
+        while stack:
+            offset, children = stack[-1]
+            for insert_time, child_sched in children:
+                if isinstance(child_sched, Schedule):
+                    stack.append((offset + insert_time, iter(child_sched._children)))
+                    break
+                yield from child_sched._instructions(offset + insert_time)
+            else:
+                stack.pop()
 
     def shift(self, time: int, name: Optional[str] = None, inplace: bool = False) -> "Schedule":
         """Return a schedule shifted forward by ``time``.
@@ -524,6 +547,10 @@ class Schedule:
         if not np.issubdtype(type(time), np.integer):
             raise PulseError("Schedule start time must be an integer.")
 
+        if isinstance(schedule, Instruction):
+            self._add_instruction_timeslots(time, schedule)
+            return
+
         other_timeslots = _get_timeslots(schedule)
         self._duration = max(self._duration, time + schedule.duration)
 
@@ -550,22 +577,70 @@ class Schedule:
                     index = _find_insertion_index(self._timeslots[channel], interval)
                     self._timeslots[channel].insert(index, interval)
                 except PulseError as ex:
-                    raise PulseError(
-                        "Schedule(name='{new}') cannot be inserted into Schedule(name='{old}') at "
-                        "time {time} because its instruction on channel {ch} scheduled from time "
-                        "{t0} to {tf} overlaps with an existing instruction."
-                        "".format(
-                            new=schedule.name or "",
-                            old=self.name or "",
-                            time=time,
-                            ch=channel,
-                            t0=interval[0],
-                            tf=interval[1],
-                        )
-                    ) from ex
+                    raise self._overlap_error(time, schedule, channel, interval) from ex
 
         _check_nonnegative_timeslot(self._timeslots)
 
+    def _add_instruction_timeslots(self, time: int, instruction: Instruction) -> None:
+        """Update time tracking for an instruction, which occupies a single interval on
+        each of its channels.
+
+        This avoids building an intermediate timeslot table for the inserted component.
+
+        Args:
+            time: The time to insert the instruction into self.
+            instruction: The instruction to insert into self.
+
+        Raises:
+            PulseError: If timeslots overlap or an invalid start time is provided.
+        """
+        duration = instruction.duration
+        # Plain non-negative integers are the overwhelmingly common case.
+        if type(duration) is not int or duration < 0:
+            instruction_duration_validation(duration)
+
+        channels = instruction.channels
+        if time < 0 and channels:
+            raise PulseError(f"An instruction on {channels[0]} has a negative starting time.")
+
+        self._duration = max(self._duration, time + duration)
+
+        interval = (time, time + duration)
+        for channel in channels:
+            ch_timeslots = self._timeslots.get(channel, None)
+            if ch_timeslots is None:
+                self._timeslots[channel] = [interval]
+            elif time >= ch_timeslots[-1][1]:
+                ch_timeslots.append(interval)
+            else:
+                try:
+                    index = _find_insertion_index(ch_timeslots, interval)
+                    ch_timeslots.insert(index, interval)
+                except PulseError as ex:
+                    raise self._overlap_error(time, instruction, channel, interval) from ex
+
+    def _overlap_error(
+        self,
+        time: int,
+        schedule: "ScheduleComponent",
+        channel: Channel,
+        interval: Interval,
+    ) -> PulseError:
+        """Create an error for a schedule component that cannot be inserted due to overlap."""
+        return PulseError(
+            "Schedule(name='{new}') cannot be inserted into Schedule(name='{old}') at "
+            "time {time} because its instruction on channel {ch} scheduled from time "
+            "{t0} to {tf} overlaps with an existing instruction."
+            "".format(
+                new=schedule.name or "",
+                old=self.name or "",
+                time=time,
+                ch=channel,
+                t0=interval[0],
+                tf=interval[1],
+            )
+        )
+
     def _remove_timeslots(self, time: int, schedule: "ScheduleComponent"):
         """Delete the timeslots if present for the respective schedule component.
 
@@ -579,13 +654,14 @@ class Schedule:
         if not isinstance(time, int):
             raise PulseError("Schedule start time must be an integer.")
 
+        other_timeslots = _get_timeslots(schedule)
+
         for channel in schedule.channels:
 
             if channel not in self._timeslots:
                 raise PulseError(f"The channel {channel} is not present in the schedule")
 
             channel_timeslots = self._timeslots[channel]
-            other_timeslots = _get_timeslots(schedule)
 
             for interval in other_timeslots[channel]:
                 if channel_timeslots:
@@ -745,7 +821,8 @@ class Schedule:
 
     def __len__(self) -> int:
         """Return number of instructions in the schedule."""
-        return len(self.instructions)
+        # Counting doesn't need the time-ordered sequence built by ``instructions``.
+        return sum(1 for _ in self._instructions())
 
     def __add__(self, other: "ScheduleComponent") -> "Schedule":
         """Return a new schedule with ``other`` inserted within ``self`` at ``start_time``."""
@@ -795,8 +872,9 @@ class Schedule:
 
     def __repr__(self) -> str:
         name = format(self._name) if self._name else ""
-        instructions = ", ".join([repr(instr) for instr in self.instructions[:50]])
-        if len(self.instructions) > 25:
+        all_instructions = self.instructions
+        instructions = ", ".join([repr(instr) for instr in all_instructions[:50]])
+        if len(all_instructions) > 25:
             instructions += ", ..."
         return f'{self.__class__.__name__}({instructions}, name="{name}")'
 
@@ -1182,7 +1260,7 @@ class ScheduleBlock:
                     f"This schedule contains unassigned reference {elm.ref_keys} "
                     "and channels are ambiguous. Please assign the subroutine first."
                 )
-            chans = chans | set(elm.channels)
+            chans.update(elm.channels)
         return tuple(chans)
 
     @property
@@ -1831,27 +1909,29 @@ def _interval_index(intervals: List[Interval], interval: Interval) -> int:
     return index
 
 
-def _locate_interval_index(intervals: List[Interval], interval: Interval, index: int = 0) -> int:
+def _locate_interval_index(intervals: List[Interval], interval: Interval) -> int:
     """Using binary search on start times, find an interval.
 
+    The search narrows the index range in place rather than recursing on list slices,
+    so that each lookup costs logarithmic time in the number of intervals.
+
     Args:
         intervals: A sorted list of non-overlapping Intervals.
         interval: The interval for which the index into intervals will be found.
-        index: A running tally of the index, for recursion. The user should not pass a value.
 
     Returns:
         The index into intervals that new_interval would be inserted to maintain
         a sorted list of intervals.
     """
-    if not intervals or len(intervals) == 1:
-        return index
-
-    mid_idx = len(intervals) // 2
-    mid = intervals[mid_idx]
-    if interval[1] <= mid[0] and (interval != mid):
-        return _locate_interval_index(intervals[:mid_idx], interval, index=index)
-    else:
-        return _locate_interval_index(intervals[mid_idx:], interval, index=index + mid_idx)
+    low, high = 0, len(intervals)
+    while high - low > 1:
+        mid_idx = (low + high) // 2
+        mid = intervals[mid_idx]
+        if interval[1] <= mid[0] and (interval != mid):
+            high = mid_idx
+        else:
+            low = mid_idx
+    return low
 
 
 def _find_insertion_index(intervals: List[Interval], new_interval: Interval) -> int:
@@ -1878,12 +1958,8 @@ def _overlaps(first: Interval, second: Interval) -> bool:
     """Return True iff first and second overlap.
     Note: first.stop may equal second.start, since Interval stop times are exclusive.
     """
-    if first[0] == second[0] == second[1]:
-        # They fail to overlap if one of the intervals has duration 0
-        return False
-    if first[0] > second[0]:
-        first, second = second, first
-    return second[0] < first[1]
+    # Strict comparisons on both ends also keep zero duration intervals at an edge disjoint
+    return first[0] < second[1] and second[0] < first[1]
 
 
 def _check_nonnegative_timeslot(timeslots: TimeSlots):
@@ -1909,7 +1985,9 @@ def _get_timeslots(schedule: "ScheduleComponent") -> TimeSlots:
     """
     if isinstance(schedule, Instruction):
         duration = schedule.duration
-        instruction_duration_validation(duration)
+        # Plain non-negative integers are the overwhelmingly common case.
+        if type(duration) is not int or duration < 0:
+            instruction_duration_validation(duration)
         timeslots = {channel: [(0, duration)] for channel in schedule.channels}
     elif isinstance(schedule, Schedule):
         timeslots = schedule.timeslots
@@ -13,7 +13,7 @@
 
 import warnings
 from collections import defaultdict
-from typing import List, Optional, Iterable, Union, Type
+from typing import Hashable, List, Optional, Iterable, Union, Type
 
 import numpy as np
 
@@ -23,6 +23,7 @@ from qiskit.pulse.exceptions import PulseError
 from qiskit.pulse.exceptions import UnassignedDurationError
 from qiskit.pulse.instruction_schedule_map import InstructionScheduleMap
 from qiskit.pulse.instructions import directives
+from qiskit.pulse.library import Pulse, ScalableSymbolicPulse, SymbolicPulse, Waveform
 from qiskit.pulse.schedule import Schedule, ScheduleBlock, ScheduleComponent
 
 
@@ -86,7 +87,12 @@ def compress_pulses(schedules: List[Schedule]) -> List[Schedule]:
     Returns:
         Compressed schedules.
     """
-    existing_pulses = []
+    # Existing pulses keyed on their content, so that the repeated pulses are found
+    # without comparing them with every existing pulse.
+    pulse_table = {}
+    # Existing pulses which may be equal to a pulse with a different content key,
+    # grouped on the fields that must match exactly. See _tolerance_group.
+    tolerance_groups = defaultdict(list)
     new_schedules = []
 
     for schedule in schedules:
@@ -94,16 +100,29 @@ def compress_pulses(schedules: List[Schedule]) -> List[Schedule]:
 
         for time, inst in schedule.instructions:
             if isinstance(inst, instructions.Play):
-                if inst.pulse in existing_pulses:
-                    idx = existing_pulses.index(inst.pulse)
-                    identical_pulse = existing_pulses[idx]
+                key = _pulse_key(inst.pulse)
+                identical_pulse = pulse_table.get(key, None) if key is not None else None
+                group = None
+                if identical_pulse is None:
+                    group = _tolerance_group(inst.pulse) if key is not None else type(inst.pulse)
+                if group is not None:
+                    existing_pulses = tolerance_groups[group]
+                    if inst.pulse in existing_pulses:
+                        identical_pulse = existing_pulses[existing_pulses.index(inst.pulse)]
+                        if key is not None:
+                            pulse_table[key] = identical_pulse
+
+                if identical_pulse is not None:
                     new_schedule.insert(
                         time,
                         instructions.Play(identical_pulse, inst.channel, inst.name),
                         inplace=True,
                     )
                 else:
-                    existing_pulses.append(inst.pulse)
+                    if key is not None:
+                        pulse_table[key] = inst.pulse
+                    if group is not None:
+                        tolerance_groups[group].append(inst.pulse)
                     new_schedule.insert(time, inst, inplace=True)
             else:
                 new_schedule.insert(time, inst, inplace=True)
@@ -113,6 +132,47 @@ def compress_pulses(schedules: List[Schedule]) -> List[Schedule]:
     return new_schedules
 
 
+def _pulse_key(pulse: Pulse) -> Optional[Hashable]:
+    """Return a hashable key of the pulse content, or ``None`` if the pulse is unhashable.
+
+    Pulses with an identical key are equal. The converse doesn't hold for waveforms,
+    which are compared within a tolerance.
+    """
+    if isinstance(pulse, SymbolicPulse):
+        key = (pulse.pulse_type, pulse.envelope, frozenset(pulse.parameters.items()))
+    else:
+        key = pulse
+    try:
+        hash(key)
+    except (TypeError, NotImplementedError):
+        return None
+    return key
+
+
+def _tolerance_group(pulse: Pulse) -> Optional[Hashable]:
+    """Return a hashable key shared by the pulses that may equal ``pulse`` with another content key.
+
+    Waveforms, and the amplitude of scalable symbolic pulses, are compared within a tolerance.
+    Such pulses are grouped on the fields that must match exactly, so that the tolerance
+    comparison is done only within the group. ``None`` is returned for the other pulses,
+    which are equal only if their content keys are identical.
+    """
+    if isinstance(pulse, Waveform):
+        group = (Waveform, pulse.duration)
+    elif isinstance(pulse, ScalableSymbolicPulse):
+        exact_params = {
+            name: value for name, value in pulse.parameters.items() if name not in ("amp", "angle")
+        }
+        group = (pulse.pulse_type, pulse.envelope, frozenset(exact_params.items()))
+    else:
+        return None
+    try:
+        hash(group)
+    except (TypeError, NotImplementedError):
+        return type(pulse)
+    return group
+
+
 def flatten(program: Schedule) -> Schedule:
     """Flatten (inline) any called nodes into a Schedule tree with no nested children.
 
@@ -161,27 +221,34 @@ def _inline_schedule(schedule: Schedule) -> Schedule:
     """A helper function to inline subroutine of schedule.
 
     .. note:: If subroutine is ``ScheduleBlock`` it is converted into Schedule to get ``t0``.
+
+    Nested schedules are inlined with an explicit stack rather than recursion,
+    because non-inplace insertion builds schedules nested deeper than the recursion limit.
     """
-    ret_schedule = Schedule.initialize_from(schedule)
-    for t0, inst in schedule.children:
+    # Each entry is the inlined schedule under construction, the iterator over the children
+    # of its source schedule, and the time at which to insert it into its parent.
+    stack = [(Schedule.initialize_from(schedule), iter(schedule.children), 0)]
+    while True:
+        ret_schedule, children, _ = stack[-1]
         # note that schedule.instructions unintentionally flatten the nested schedule.
         # this should be performed by another transformer node.
-        if isinstance(inst, instructions.Call):
-            # bind parameter
-            subroutine = inst.assigned_subroutine()
-            # convert into schedule if block is given
-            if isinstance(subroutine, ScheduleBlock):
-                subroutine = block_to_schedule(subroutine)
-            # recursively inline the program
-            inline_schedule = _inline_schedule(subroutine)
-            ret_schedule.insert(t0, inline_schedule, inplace=True)
-        elif isinstance(inst, Schedule):
-            # recursively inline the program
-            inline_schedule = _inline_schedule(inst)
-            ret_schedule.insert(t0, inline_schedule, inplace=True)
-        else:
+        for t0, inst in children:
+            if isinstance(inst, instructions.Call):
+                # bind parameter
+                inst = inst.assigned_subroutine()
+                # convert into schedule if block is given
+                if isinstance(inst, ScheduleBlock):
+                    inst = block_to_schedule(inst)
+            if isinstance(inst, Schedule):
+                # inline the program, and insert it once all its children are inlined
+                stack.append((Schedule.initialize_from(inst), iter(inst.children), t0))
+                break
             ret_schedule.insert(t0, inst, inplace=True)
-    return ret_schedule
+        else:
+            ret_schedule, _, t0 = stack.pop()
+            if not stack:
+                return ret_schedule
+            stack[-1][0].insert(t0, ret_schedule, inplace=True)
 
 
 def _inline_block(block: ScheduleBlock) -> ScheduleBlock:
@@ -12,8 +12,11 @@
 
 """Helper class used to convert a user LO configuration into a list of frequencies."""
 
+import numpy as np
+
 from qiskit.pulse.channels import DriveChannel, MeasureChannel
-from qiskit.pulse.configuration import LoConfig
+from qiskit.pulse.configuration import LoConfig, LoRange
+from qiskit.pulse.exceptions import PulseError
 from qiskit.exceptions import QiskitError
 
 
@@ -52,15 +55,21 @@ class LoConfigConverter:
         self.run_config = run_config
         self.n_qubits = self.run_config.get("n_qubits", None)
 
-        self.default_lo_config = LoConfig()
-
-        if qubit_lo_range:
-            for i, lo_range in enumerate(qubit_lo_range):
-                self.default_lo_config.add_lo_range(DriveChannel(i), lo_range)
-
-        if meas_lo_range:
-            for i, lo_range in enumerate(meas_lo_range):
-                self.default_lo_config.add_lo_range(MeasureChannel(i), lo_range)
+        # Build all channel ranges in bulk rather than converting them one qubit at a time.
+        # They are also kept in channel index order, so that validating experiment level LO's
+        # is a list lookup instead of hashing every channel.
+        self._qubit_lo_ranges = [_as_lo_range(lo_range) for lo_range in qubit_lo_range or []]
+        self._meas_lo_ranges = [_as_lo_range(lo_range) for lo_range in meas_lo_range or []]
+        lo_ranges = dict(
+            zip(map(DriveChannel, range(len(self._qubit_lo_ranges))), self._qubit_lo_ranges)
+        )
+        lo_ranges.update(
+            zip(map(MeasureChannel, range(len(self._meas_lo_ranges))), self._meas_lo_ranges)
+        )
+        self.default_lo_config = LoConfig(lo_ranges=lo_ranges)
+
+        # LO frequencies already computed by this converter, keyed on the LO entries.
+        self._experiment_los = {}
 
     def __call__(self, user_lo_config):
         """Return experiment config w/ LO values property configured.
@@ -71,17 +80,29 @@ class LoConfigConverter:
         Returns:
             Union[PulseQobjExperimentConfig, QasmQobjExperimentConfig]: Qobj experiment config.
         """
+        # LoConfig is mutable, so key on a snapshot of its entries rather than the instance.
+        key = (tuple(user_lo_config.qubit_los.items()), tuple(user_lo_config.meas_los.items()))
+        lo_config = self._experiment_los.get(key, None)
+        if lo_config is None:
+            lo_config = self._experiment_los[key] = self._compute_lo_config(user_lo_config)
+
+        # Experiment configs are mutable, so a fresh one is built on every call.
+        return self.qobj_model(**{name: list(los) for name, los in lo_config.items()})
+
+    def _compute_lo_config(self, user_lo_config):
+        """Return the experiment level LO frequencies in GHz, keyed on the config field name."""
         lo_config = {}
 
+        # Hz -> GHz, converted in one array operation rather than per frequency
         q_los = self.get_qubit_los(user_lo_config)
         if q_los:
-            lo_config["qubit_lo_freq"] = [freq / 1e9 for freq in q_los]
+            lo_config["qubit_lo_freq"] = (np.asarray(q_los) / 1e9).tolist()
 
         m_los = self.get_meas_los(user_lo_config)
         if m_los:
-            lo_config["meas_lo_freq"] = [freq / 1e9 for freq in m_los]
+            lo_config["meas_lo_freq"] = (np.asarray(m_los) / 1e9).tolist()
 
-        return self.qobj_model(**lo_config)
+        return lo_config
 
     def get_qubit_los(self, user_lo_config):
         """Set experiment level qubit LO frequencies. Use default values from job level if
@@ -98,6 +119,13 @@ class LoConfigConverter:
         Raises:
             QiskitError: When LO frequencies are missing and no default is set at job level.
         """
+        # read the property once, it is consulted several times below
+        user_los = user_lo_config.qubit_los
+
+        # nothing to override, experiment level LO's are identical to the job level default
+        if self.qubit_lo_freq and not user_los:
+            return None
+
         _q_los = None
 
         # try to use job level default values
@@ -109,8 +137,9 @@ class LoConfigConverter:
 
         # fill experiment level LO's
         if _q_los:
-            for channel, lo_freq in user_lo_config.qubit_los.items():
-                self.default_lo_config.check_lo(channel, lo_freq)
+            lo_ranges = self._qubit_lo_ranges
+            for channel, lo_freq in user_los.items():
+                _check_lo_range(lo_ranges, channel.index, lo_freq)
                 _q_los[channel.index] = lo_freq
 
             if _q_los == self.qubit_lo_freq:
@@ -140,6 +169,13 @@ class LoConfigConverter:
         Raises:
             QiskitError: When LO frequencies are missing and no default is set at job level.
         """
+        # read the property once, it is consulted several times below
+        user_los = user_lo_config.meas_los
+
+        # nothing to override, experiment level LO's are identical to the job level default
+        if self.meas_lo_freq and not user_los:
+            return None
+
         _m_los = None
         # try to use job level default values
         if self.meas_lo_freq:
@@ -150,8 +186,9 @@ class LoConfigConverter:
 
         # fill experiment level LO's
         if _m_los:
-            for channel, lo_freq in user_lo_config.meas_los.items():
-                self.default_lo_config.check_lo(channel, lo_freq)
+            lo_ranges = self._meas_lo_ranges
+            for channel, lo_freq in user_los.items():
+                _check_lo_range(lo_ranges, channel.index, lo_freq)
                 _m_los[channel.index] = lo_freq
 
             if _m_los == self.meas_lo_freq:
@@ -166,3 +203,28 @@ class LoConfigConverter:
                 )
 
         return _m_los
+
+
+def _as_lo_range(lo_range):
+    """Build :class:`.LoRange` from a ``[min, max]`` pair, as :meth:`.LoConfig.add_lo_range` does.
+
+    Any other value, e.g. a :class:`.LoRange` instance, is returned unchanged.
+    """
+    if isinstance(lo_range, (list, tuple)):
+        return LoRange(*lo_range)
+    return lo_range
+
+
+def _check_lo_range(lo_ranges, index, lo_freq):
+    """Check that an LO frequency is within the range of the channel with the given index.
+
+    Args:
+        lo_ranges (List[LoRange]): LO ranges ordered by channel index.
+        index (int): Index of the channel.
+        lo_freq (float): LO frequency to validate.
+
+    Raises:
+        PulseError: If the frequency is outside of the channel range.
+    """
+    if index < len(lo_ranges) and not lo_ranges[index].includes(lo_freq):
+        raise PulseError(f"Specified LO freq {lo_freq:f} is out of range {lo_ranges[index]}")
@@ -73,6 +73,26 @@ class QobjMeasurementOption:
 class PulseQobjInstruction:
     """A class representing a single instruction in an PulseQobj Experiment."""
 
+    __slots__ = (
+        "name",
+        "t0",
+        "ch",
+        "conditional",
+        "val",
+        "phase",
+        "frequency",
+        "duration",
+        "qubits",
+        "memory_slot",
+        "register_slot",
+        "kernels",
+        "discriminators",
+        "label",
+        "type",
+        "pulse_shape",
+        "parameters",
+    )
+
     _COMMON_ATTRS = [
         "ch",
         "conditional",
@@ -502,7 +522,10 @@ class PulseLibraryItem:
         """
         self.name = name
         if isinstance(samples[0], list):
-            self.samples = numpy.array([complex(sample[0], sample[1]) for sample in samples])
+            # Reinterpret the [re, im] pairs as complex values without a per-sample Python loop.
+            self.samples = (
+                numpy.ascontiguousarray(samples, dtype=numpy.float64).view(numpy.complex128).ravel()
+            )
         else:
             self.samples = samples
 
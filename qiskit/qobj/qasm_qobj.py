@@ -23,6 +23,21 @@ from qiskit.qobj.common import QobjDictField, QobjHeader
 class QasmQobjInstruction:
     """A class representing a single instruction in an QasmQobj Experiment."""
 
+    __slots__ = (
+        "name",
+        "params",
+        "qubits",
+        "register",
+        "memory",
+        "_condition",
+        "conditional",
+        "label",
+        "mask",
+        "relation",
+        "val",
+        "snapshot_type",
+    )
+
     def __init__(
         self,
         name,
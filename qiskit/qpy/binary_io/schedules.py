@@ -315,7 +315,6 @@ def _read_element(file_obj, version, metadata_deserializer, use_symengine):
     instance = object.__new__(type_keys.ScheduleInstruction.retrieve(type_key))
     instance._operands = tuple(operands)
     instance._name = name
-    instance._hash = None
 
     return instance
 
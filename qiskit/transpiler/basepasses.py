@@ -14,9 +14,10 @@
 from __future__ import annotations
 
 import abc
+import functools
 from abc import abstractmethod
 from collections.abc import Callable, Hashable, Iterable
-from inspect import signature
+from inspect import Signature, signature
 
 from qiskit.circuit import QuantumCircuit
 from qiskit.converters import circuit_to_dag, dag_to_circuit
@@ -28,6 +29,16 @@ from .exceptions import TranspilerError
 from .layout import TranspileLayout
 
 
+@functools.lru_cache(maxsize=None)
+def _init_signature(init: Callable) -> Signature:
+    """Return the signature of a pass constructor.
+
+    Inspecting the signature is costly compared to the rest of the pass instantiation,
+    and it never changes for a given constructor.
+    """
+    return signature(init)
+
+
 class MetaPass(abc.ABCMeta):
     """Metaclass for transpiler passes.
 
@@ -55,11 +66,11 @@ class MetaPass(abc.ABCMeta):
     @staticmethod
     def _freeze_init_parameters(class_, args, kwargs):
         self_guard = object()
-        init_signature = signature(class_.__init__)
+        init_signature = _init_signature(class_.__init__)
         bound_signature = init_signature.bind(self_guard, *args, **kwargs)
         arguments = [("class_.__name__", class_.__name__)]
         for name, value in bound_signature.arguments.items():
-            if value == self_guard:
+            if value is self_guard:
                 continue
             if isinstance(value, Hashable):
                 arguments.append((name, type(value), value))
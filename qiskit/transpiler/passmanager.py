@@ -13,12 +13,12 @@
 """Manager for a set of Passes and their scheduling during transpilation."""
 from __future__ import annotations
 
-import inspect
 import io
 import re
 import warnings
 from collections.abc import Iterator, Iterable, Callable
 from functools import wraps
+from types import FunctionType
 from typing import Union, List, Any
 
 from qiskit.circuit import QuantumCircuit
@@ -557,8 +557,8 @@ def _replace_error(meth):
     return wrapper
 
 
-for _name, _method in inspect.getmembers(PassManager, predicate=inspect.isfunction):
-    if _name.startswith("_"):
+for _name, _method in list(vars(PassManager).items()):
+    if _name.startswith("_") or not isinstance(_method, FunctionType):
         # Ignore protected and private.
         # User usually doesn't directly execute and catch error from these methods.
         continue
@@ -42,6 +42,17 @@ from .layout import TranspileLayout
 logger = logging.getLogger(__name__)
 
 
+def _may_modify_ir(tasks) -> bool:
+    """Return ``False`` only if the tasks, including their requirements, are all analysis passes."""
+    for task in tasks:
+        if isinstance(task, BaseController):
+            if not hasattr(task, "tasks") or _may_modify_ir(task.tasks):
+                return True
+        elif not getattr(task, "is_analysis_pass", False) or _may_modify_ir(task.requires):
+            return True
+    return False
+
+
 class RunningPassManager(FlowControllerLinear):
     """A RunningPassManager is a running pass manager.
 
@@ -123,8 +134,11 @@ class RunningPassManager(FlowControllerLinear):
             callback=callback,
         )
 
-        out_circuit = dag_to_circuit(passmanager_ir, copy_operations=False)
-        out_circuit.name = output_name
+        if _may_modify_ir(self.tasks):
+            # An analysis-only pipeline leaves the DAG as converted from the input circuit,
+            # so the reverse conversion is skipped in that case.
+            out_circuit = dag_to_circuit(passmanager_ir, copy_operations=False)
+            out_circuit.name = output_name
 
         if state.property_set["layout"] is not None:
             circuit._layout = TranspileLayout(
@@ -281,6 +281,12 @@ class DrawerCanvas:
             else:
                 self.chan_scales[chan] = 1.0
 
+        # bucket instructions by channel once, rather than filtering the program per channel
+        chan_instructions = {chan: [] for chan in program.channels}
+        for t0, inst in program.instructions:
+            for chan in inst.channels:
+                chan_instructions[chan].append((t0, inst))
+
         # create charts
         mapper = self.layout["chart_channel_map"]
         for name, chans in mapper(
@@ -291,7 +297,9 @@ class DrawerCanvas:
 
             # add standard pulse instructions
             for chan in chans:
-                chart.load_program(program=program, chan=chan)
+                chart.load_program(
+                    program=program, chan=chan, instructions=chan_instructions.get(chan, [])
+                )
 
             # add barriers
             barrier_sched = program.filter(
@@ -473,7 +481,12 @@ class Chart:
         """
         self._collections[data.data_key] = data
 
-    def load_program(self, program: pulse.Schedule, chan: pulse.channels.Channel):
+    def load_program(
+        self,
+        program: pulse.Schedule,
+        chan: pulse.channels.Channel,
+        instructions: Sequence[tuple[int, pulse.Instruction]] | None = None,
+    ):
         """Load pulse schedule.
 
         This method internally generates `ChannelEvents` to parse the program
@@ -482,8 +495,13 @@ class Chart:
         Args:
             program: Pulse schedule to load.
             chan: A pulse channels associated with this instance.
+            instructions: Time-ordered instructions of the flattened program that operate on
+                ``chan``. They are filtered from ``program`` if not provided.
         """
-        chan_events = events.ChannelEvents.load_program(program, chan)
+        if instructions is None:
+            chan_events = events.ChannelEvents.load_program(program, chan)
+        else:
+            chan_events = events.ChannelEvents.load_instructions(instructions, chan)
         chan_events.set_config(
             dt=self.parent.device.dt,
             init_frequency=self.parent.device.get_channel_frequency(chan),
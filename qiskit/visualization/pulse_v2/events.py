@@ -80,7 +80,7 @@ than plotting each operand value bound to the instruction.
 """
 from __future__ import annotations
 from collections import defaultdict
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 
 from qiskit import pulse, circuit
 from qiskit.visualization.pulse_v2.types import PhaseFreqTuple, PulseInstruction
@@ -133,6 +133,23 @@ class ChannelEvents:
             program: Target ``Schedule`` to visualize.
             channel: The channel managed by this instance.
 
+        Returns:
+            ChannelEvents: The channel event manager for the specified channel.
+        """
+        return cls.load_instructions(program.filter(channels=[channel]).instructions, channel)
+
+    @classmethod
+    def load_instructions(
+        cls,
+        instructions: Iterable[tuple[int, pulse.Instruction]],
+        channel: pulse.channels.Channel,
+    ):
+        """Load time-ordered instructions of a flat program that operate on the channel.
+
+        Args:
+            instructions: Pairs of start time and instruction operating on ``channel``.
+            channel: The channel managed by this instance.
+
         Returns:
             ChannelEvents: The channel event manager for the specified channel.
         """
@@ -140,7 +157,7 @@ class ChannelEvents:
         frames = defaultdict(list)
 
         # parse instructions
-        for t0, inst in program.filter(channels=[channel]).instructions:
+        for t0, inst in instructions:
             if isinstance(inst, cls._waveform_group):
                 if inst.duration == 0:
                     # special case, duration of delay can be zero
@@ -89,10 +89,9 @@ def gen_filled_waveform_stepwise(
         ydata = waveform_data.yvals
 
         # phase modulation
-        if formatter["control.apply_phase_modulation"]:
-            ydata = np.asarray(ydata, dtype=complex) * np.exp(1j * data.frame.phase)
-        else:
-            ydata = np.asarray(ydata, dtype=complex)
+        ydata = np.asarray(ydata, dtype=complex)
+        if formatter["control.apply_phase_modulation"] and data.frame.phase != 0:
+            ydata = ydata * np.exp(1j * data.frame.phase)
 
         return _draw_shaped_waveform(
             xdata=xdata, ydata=ydata, meta=meta, channel=channel, formatter=formatter
@@ -281,10 +280,9 @@ def gen_waveform_max_value(
         return []
 
     # phase modulation
-    if formatter["control.apply_phase_modulation"]:
-        ydata = np.asarray(ydata, dtype=complex) * np.exp(1j * data.frame.phase)
-    else:
-        ydata = np.asarray(ydata, dtype=complex)
+    ydata = np.asarray(ydata, dtype=complex)
+    if formatter["control.apply_phase_modulation"] and data.frame.phase != 0:
+        ydata = ydata * np.exp(1j * data.frame.phase)
 
     texts = []
 
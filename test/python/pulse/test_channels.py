@@ -12,6 +12,7 @@
 
 """Test cases for the pulse channel group."""
 
+import pickle
 import unittest
 
 from qiskit.pulse.channels import (
@@ -68,6 +69,15 @@ class TestAcquireChannel(QiskitTestCase):
 
         self.assertEqual(hash_1, hash_2)
 
+    def test_channel_hash_pickle(self):
+        """Test hashing for acquire channel is consistent after pickling."""
+        acq_channel = AcquireChannel(123)
+        reloaded = pickle.loads(pickle.dumps(acq_channel))
+
+        self.assertEqual(acq_channel, reloaded)
+        self.assertEqual(hash(acq_channel), hash(reloaded))
+        self.assertIn(reloaded, {acq_channel: 0})
+
 
 class TestClassicalIOChannel(QiskitTestCase):
     """Test base classical IO channel."""
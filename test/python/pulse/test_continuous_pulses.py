@@ -156,6 +156,23 @@ class TestContinuousPulses(QiskitTestCase):
         self.assertTrue(np.all((-amp <= sin_arr) & (sin_arr <= amp)))
         self.assertEqual(len(sin_arr), samples)
 
+    def test_sinusoid_complex_args(self):
+        """Test sinusoids with complex valued times, frequency and phase."""
+        times = np.linspace(0, 10, 11)
+        for kwargs in [
+            {"times": times.astype(np.complex128), "freq": 0.2, "phase": 0.1},
+            {"times": times, "freq": 0.2 + 0j, "phase": 0.1},
+            {"times": times, "freq": 0.2, "phase": 0.1 + 0.01j},
+        ]:
+            with self.subTest(kwargs=kwargs):
+                angles = 2 * np.pi * kwargs["freq"] * kwargs["times"] + kwargs["phase"]
+                np.testing.assert_allclose(
+                    continuous.cos(amp=0.5, **kwargs), 0.5 * np.cos(angles), atol=1e-12
+                )
+                np.testing.assert_allclose(
+                    continuous.sin(amp=0.5, **kwargs), 0.5 * np.sin(angles), atol=1e-12
+                )
+
     def test_gaussian(self):
         """Test gaussian pulse."""
         amp = 0.5
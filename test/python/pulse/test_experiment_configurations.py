@@ -39,6 +39,15 @@ class TestLoRange(QiskitTestCase):
         self.assertTrue(lo_range_1 == lo_range_2)
         self.assertFalse(lo_range_1 == lo_range_3)
 
+    def test_hash(self):
+        """Test equal LoRange's have the same hash and can be used as set members."""
+        lo_range_1 = LoRange(lower_bound=-0.1, upper_bound=+0.1)
+        lo_range_2 = LoRange(lower_bound=-0.1, upper_bound=+0.1)
+        lo_range_3 = LoRange(lower_bound=-0.2, upper_bound=+0.2)
+
+        self.assertEqual(hash(lo_range_1), hash(lo_range_2))
+        self.assertEqual(len({lo_range_1, lo_range_2, lo_range_3}), 2)
+
 
 class TestLoConfig(QiskitTestCase):
     """LoConfig tests."""
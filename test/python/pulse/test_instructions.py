@@ -12,6 +12,8 @@
 
 """Unit tests for pulse instructions."""
 
+import pickle
+
 import numpy as np
 
 from qiskit import pulse, circuit
@@ -304,6 +306,15 @@ class TestPlay(QiskitTestCase):
         with self.assertRaises(exceptions.PulseError):
             instructions.Play(self.pulse_op, channels.AcquireChannel(0))
 
+    def test_play_has_no_instance_dict(self):
+        """Test that instructions are slotted and still survive pickling."""
+        play = instructions.Play(self.pulse_op, channels.DriveChannel(1), name="slotted")
+
+        self.assertFalse(hasattr(play, "__dict__"))
+        self.assertIsInstance(play, instructions.Instruction)
+        self.assertEqual(pickle.loads(pickle.dumps(play)), play)
+        self.assertEqual(pickle.loads(pickle.dumps(play)).name, "slotted")
+
 
 class TestDirectives(QiskitTestCase):
     """Test pulse directives."""
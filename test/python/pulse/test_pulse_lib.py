@@ -13,6 +13,7 @@
 """Unit tests for pulse waveforms."""
 
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch
 import numpy as np
 
@@ -37,6 +38,7 @@ from qiskit.pulse.library import (
 )
 
 from qiskit.pulse import functional_pulse, PulseError
+from qiskit.pulse.library.symbolic_pulses import _EnvelopeSampleCache
 from qiskit.test import QiskitTestCase
 from qiskit.utils import optionals as _optional
 
@@ -72,6 +74,22 @@ class TestWaveform(QiskitTestCase):
 
         self.assertEqual({sample_pulse, sample_pulse2}, {sample_pulse})
 
+    def test_array_interface(self):
+        """Test a waveform converts to a read-only view of its samples."""
+        waveform = Waveform([0.1, 0.2j, 0.3])
+
+        samples = np.asarray(waveform)
+        self.assertTrue(np.shares_memory(samples, waveform.samples))
+        self.assertFalse(samples.flags.writeable)
+        with self.assertRaises(ValueError):
+            samples[0] = 0.5
+        np.testing.assert_array_equal(
+            np.asarray(waveform, dtype=np.complex64), waveform.samples.astype(np.complex64)
+        )
+        self.assertTrue(np.array(waveform).flags.writeable)
+
+        self.assertFalse(np.asarray([0.1, 0.2j, 0.3]) == waveform)
+
     def test_type_casting(self):
         """Test casting of input samples to numpy array."""
         n_samples = 100
@@ -90,6 +108,11 @@ class TestWaveform(QiskitTestCase):
         sample_pulse_list = Waveform(samples_list)
         self.assertEqual(sample_pulse_list.samples.dtype, np.complex128)
 
+        samples_strided = np.linspace(0, 1.0, 2 * n_samples, dtype=np.complex128)[::2]
+
+        sample_pulse_strided = Waveform(samples_strided)
+        self.assertTrue(sample_pulse_strided.samples.flags.c_contiguous)
+
     def test_pulse_limits(self):
         """Test that limits of pulse norm of one are enforced properly."""
 
@@ -173,6 +196,122 @@ class TestSymbolicPulses(QiskitTestCase):
             gauss_pulse_complex_amp.get_waveform().samples,
         )
 
+    def test_get_waveform_of_identical_pulses(self):
+        """Test identical pulses return equal waveforms that do not share sample buffers."""
+        waveform1 = Drag(duration=25, amp=0.6, sigma=7.8, beta=4).get_waveform()
+        waveform2 = Drag(duration=25, amp=0.6, sigma=7.8, beta=4).get_waveform()
+
+        np.testing.assert_array_equal(waveform1.samples, waveform2.samples)
+        self.assertFalse(np.shares_memory(waveform1.samples, waveform2.samples))
+
+    def test_library_envelopes_match_symbolic_evaluation(self):
+        """Test the NumPy evaluation of library pulses agrees with their symbolic envelopes."""
+        pulses = [
+            Gaussian(duration=25, amp=0.5, sigma=4, angle=np.pi / 2),
+            Gaussian(duration=24, amp=0.5, sigma=4),
+            GaussianSquare(duration=125, amp=0.1, sigma=15, width=100, angle=np.pi / 5),
+            GaussianSquare(duration=50, amp=0.3, sigma=14, width=0),
+            Drag(duration=25, amp=0.6, sigma=7.8, beta=4, angle=np.pi * 0.54),
+            Constant(duration=150, amp=0.5, angle=np.pi * 0.23),
+        ]
+        for pulse in pulses:
+            with self.subTest(pulse_type=pulse.pulse_type, duration=pulse.duration):
+                # A custom pulse type with the same envelope is evaluated symbolically.
+                parameters = pulse.parameters.copy()
+                del parameters["duration"]
+                reference = SymbolicPulse(
+                    pulse_type="Custom",
+                    duration=pulse.duration,
+                    parameters=parameters,
+                    envelope=pulse.envelope,
+                )
+                np.testing.assert_array_almost_equal(
+                    pulse.get_waveform().samples, reference.get_waveform().samples
+                )
+
+    def test_library_envelope_with_extra_parameter(self):
+        """Test a library pulse type with an extra parameter is evaluated symbolically."""
+        gaussian = Gaussian(duration=25, amp=0.5, sigma=4, angle=np.pi / 3)
+        parameters = gaussian.parameters.copy()
+        del parameters["duration"]
+        parameters["extra"] = 1.0
+        pulse = SymbolicPulse(
+            pulse_type="Gaussian",
+            duration=25,
+            parameters=parameters,
+            envelope=gaussian.envelope,
+        )
+        np.testing.assert_array_almost_equal(
+            pulse.get_waveform().samples, gaussian.get_waveform().samples
+        )
+
+    def test_constraints_with_functions_missing_in_math_module(self):
+        """Test constraints are evaluated when they use a function the math module lacks."""
+        t, amp, sigma = sym.symbols("t, amp, sigma")
+        constraints = sym.zeta(sigma) < 2
+
+        SymbolicPulse(
+            pulse_type="Custom",
+            duration=10,
+            parameters={"amp": 0.1, "sigma": 2.0},
+            envelope=amp * t / 10,
+            constraints=constraints,
+        )
+        with self.assertRaises(PulseError):
+            SymbolicPulse(
+                pulse_type="Custom",
+                duration=10,
+                parameters={"amp": 0.1, "sigma": 1.5},
+                envelope=amp * t / 10,
+                constraints=constraints,
+            )
+
+    def test_constraints_with_math_domain_error(self):
+        """Test constraints raising a math domain error are reported as a violation."""
+        t, amp, sigma = sym.symbols("t, amp, sigma")
+
+        with self.assertRaises(PulseError):
+            SymbolicPulse(
+                pulse_type="Custom",
+                duration=10,
+                parameters={"amp": 0.1, "sigma": -1.0},
+                envelope=amp * t / 10,
+                constraints=sym.sqrt(sigma) < 2,
+            )
+
+    def test_envelope_sample_cache_is_bounded_by_samples(self):
+        """Test the envelope sample cache evicts the least recently used entries by size."""
+        cache = _EnvelopeSampleCache(max_samples=10)
+        cache.put("a", np.zeros(4))
+        cache.put("b", np.zeros(4))
+        self.assertIsNotNone(cache.get("a"))
+        cache.put("c", np.zeros(4))
+
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("c"))
+
+        cache.put("d", np.zeros(11))
+        self.assertIsNone(cache.get("d"))
+        self.assertIsNotNone(cache.get("a"))
+
+    def test_envelope_sample_cache_threads(self):
+        """Test the envelope sample cache stays consistent under concurrent access."""
+        cache = _EnvelopeSampleCache(max_samples=64)
+
+        def fill(offset):
+            for i in range(500):
+                key = (offset + i) % 50
+                if cache.get(key) is None:
+                    cache.put(key, np.zeros(4))
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for future in [executor.submit(fill, offset) for offset in range(8)]:
+                future.result()
+
+        self.assertLessEqual(cache._num_samples, cache.max_samples)
+        self.assertEqual(cache._num_samples, sum(v.size for v in cache._entries.values()))
+
     def test_gauss_square_extremes(self):
         """Test that the gaussian square pulse can build a gaussian."""
         duration = 125
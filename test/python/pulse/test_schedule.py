@@ -11,6 +11,7 @@
 # that they have been altered from the originals.
 
 """Test cases for the pulse schedule."""
+import sys
 import unittest
 from unittest.mock import patch
 
@@ -246,6 +247,17 @@ class TestScheduleBuilding(BaseTestSchedule):
         start_times = sorted(shft + instr.start_time for shft, instr in sched.instructions)
         self.assertEqual([0, 30, 40], start_times)
 
+    def test_instructions_of_deeply_nested_schedule(self):
+        """Test flattening a schedule nested deeper than the recursion limit."""
+        play = Play(Constant(10, 0.1), self.config.drive(0))
+
+        sched = Schedule()
+        for _ in range(sys.getrecursionlimit() + 100):
+            sched = sched.append(play)
+
+        start_times = [t0 for t0, _ in sched.instructions]
+        self.assertEqual(start_times, list(range(0, sched.duration, 10)))
+
     def test_shift_schedule(self):
         """Test shift schedule."""
         lp0 = self.linear(duration=10, slope=0.02, intercept=0.01)
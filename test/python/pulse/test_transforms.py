@@ -11,6 +11,7 @@
 # that they have been altered from the originals.
 
 """Test cases for the pulse Schedule transforms."""
+import sys
 import unittest
 from typing import List, Set
 
@@ -452,6 +453,20 @@ class TestCompressTransform(QiskitTestCase):
         self.assertEqual(len(original_pulse_ids), 8)
         self.assertEqual(len(compressed_pulse_ids), 4)
 
+    def test_parametric_pulses_with_duplicates_within_tolerance(self):
+        """Test with parametric pulses which are equal only within a tolerance."""
+        schedule = Schedule()
+        drive_channel = DriveChannel(0)
+        schedule += Play(Gaussian(duration=25, sigma=4, amp=0.5, angle=0.0), drive_channel)
+        schedule += Play(Gaussian(duration=25, sigma=4, amp=-0.5, angle=np.pi), drive_channel)
+        schedule += Play(Gaussian(duration=25, sigma=5, amp=-0.5, angle=np.pi), drive_channel)
+
+        compressed_schedule = transforms.compress_pulses([schedule])
+        original_pulse_ids = get_pulse_ids([schedule])
+        compressed_pulse_ids = get_pulse_ids(compressed_schedule)
+        self.assertEqual(len(original_pulse_ids), 3)
+        self.assertEqual(len(compressed_pulse_ids), 2)
+
     def test_parametric_pulses_with_no_duplicates(self):
         """Test parametric pulses with no duplicates."""
         schedule = Schedule()
@@ -846,6 +861,22 @@ class TestFlatten(QiskitTestCase):
         self.assertEqual(flattened, reference)
         self.assertNotEqual(grouped, reference)
 
+    def test_target_qobj_transform_of_deeply_nested_schedule(self):
+        """Test inlining and flattening a schedule nested deeper than the recursion limit."""
+        d0 = pulse.DriveChannel(0)
+
+        schedule = pulse.Schedule()
+        for _ in range(sys.getrecursionlimit() + 100):
+            schedule = schedule.append(instructions.Delay(3, d0))
+
+        flattened = transforms.target_qobj_transform(schedule)
+
+        reference = pulse.Schedule()
+        for t0 in range(0, schedule.duration, 3):
+            reference.insert(t0, instructions.Delay(3, d0), inplace=True)
+
+        self.assertEqual(flattened, reference)
+
 
 class _TestDirective(directives.Directive):
     """Pulse ``RelativeBarrier`` directive."""
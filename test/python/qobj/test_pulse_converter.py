@@ -13,9 +13,10 @@
 """Converter Test."""
 
 import hashlib
+from unittest.mock import patch
 import numpy as np
 
-from qiskit.pulse import LoConfig, Kernel, Discriminator
+from qiskit.pulse import LoConfig, LoRange, Kernel, Discriminator, PulseError
 from qiskit.pulse.channels import (
     DriveChannel,
     ControlChannel,
@@ -464,3 +465,43 @@ class TestLoConverter(QiskitTestCase):
         valid_qobj = PulseQobjExperimentConfig(meas_lo_freq=[3.5])
 
         self.assertEqual(converter(user_lo_config), valid_qobj)
+
+    def test_identical_los_reuse_config(self):
+        """Test LO configurations with the same entries are converted only once."""
+        converter = LoConfigConverter(
+            PulseQobjExperimentConfig, [1.2e9], [3.4e9], [(0.0, 5e9)], [(0.0, 5e9)]
+        )
+
+        with patch.object(converter, "get_qubit_los", wraps=converter.get_qubit_los) as mock_los:
+            config1 = converter(LoConfig({DriveChannel(0): 1.3e9}))
+            config2 = converter(LoConfig({DriveChannel(0): 1.3e9}))
+            config3 = converter(LoConfig({DriveChannel(0): 1.4e9}))
+        self.assertEqual(mock_los.call_count, 2)
+
+        self.assertEqual(config1, config2)
+        self.assertEqual(config3, PulseQobjExperimentConfig(qubit_lo_freq=[1.4]))
+
+        # configs are not shared between experiments
+        config1.qubit_lo_freq[0] = 1.5
+        self.assertEqual(config2, PulseQobjExperimentConfig(qubit_lo_freq=[1.3]))
+        self.assertEqual(
+            converter(LoConfig({DriveChannel(0): 1.3e9})),
+            PulseQobjExperimentConfig(qubit_lo_freq=[1.3]),
+        )
+
+    def test_lo_range_instances(self):
+        """Test LO ranges given as LoRange instances are used as they are."""
+        converter = LoConfigConverter(
+            PulseQobjExperimentConfig,
+            [1.2e9],
+            [3.4e9],
+            [LoRange(0.0, 5e9)],
+            [LoRange(0.0, 5e9)],
+        )
+
+        self.assertEqual(
+            converter(LoConfig({DriveChannel(0): 1.3e9})),
+            PulseQobjExperimentConfig(qubit_lo_freq=[1.3]),
+        )
+        with self.assertRaises(PulseError):
+            converter(LoConfig({MeasureChannel(0): 5.5e9}))
@@ -72,7 +72,7 @@ class TestQASMQobj(QiskitTestCase):
             ],
         }
 
-        self.bad_qobj = copy.deepcopy(self.valid_qobj)
+        self.bad_qobj = copy.copy(self.valid_qobj)
         self.bad_qobj.experiments = []
 
     def test_from_dict_per_class(self):
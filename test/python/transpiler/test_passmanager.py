@@ -15,6 +15,7 @@
 """Test the passmanager logic"""
 
 import copy
+from unittest.mock import patch
 
 import numpy as np
 
@@ -22,7 +23,8 @@ from qiskit import QuantumRegister, QuantumCircuit
 from qiskit.circuit.library import U2Gate
 from qiskit.converters import circuit_to_dag
 from qiskit.passmanager.flow_controllers import FlowControllerLinear
-from qiskit.transpiler import PassManager, PropertySet, TransformationPass
+from qiskit.transpiler import AnalysisPass, PassManager, PropertySet, TransformationPass
+from qiskit.transpiler.runningpassmanager import RunningPassManager
 from qiskit.transpiler.passes import CommutativeCancellation
 from qiskit.transpiler.passes import Optimize1qGates, Unroller
 from qiskit.test import QiskitTestCase
@@ -181,3 +183,32 @@ class TestPassManager(QiskitTestCase):
             "third 4",
         ]
         self.assertEqual(calls, expected)
+
+    def test_running_passmanager_skips_conversion_for_analysis(self):
+        """Test that the DAG is not converted back when only analysis passes ran."""
+
+        class Analysis(AnalysisPass):
+            def run(self, dag):
+                self.property_set["clbit_write_latency"] = 10
+
+        class Transformation(TransformationPass):
+            def run(self, dag):
+                return dag
+
+        circuit = QuantumCircuit(1)
+        circuit.h(0)
+
+        running_pm = RunningPassManager([Analysis()])
+        with patch("qiskit.transpiler.runningpassmanager.dag_to_circuit") as mock_convert:
+            with self.assertWarns(PendingDeprecationWarning):
+                out = running_pm.run(circuit)
+        mock_convert.assert_not_called()
+        self.assertIs(out, circuit)
+        self.assertEqual(out._clbit_write_latency, 10)
+
+        running_pm = RunningPassManager([Analysis(), Transformation()])
+        with patch("qiskit.transpiler.runningpassmanager.dag_to_circuit") as mock_convert:
+            with self.assertWarns(PendingDeprecationWarning):
+                out = running_pm.run(circuit)
+        mock_convert.assert_called_once()
+        self.assertIs(out, circuit)
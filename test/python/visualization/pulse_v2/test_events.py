@@ -60,6 +60,25 @@ class TestChannelEvents(QiskitTestCase):
         self.assertEqual(inst_data1.frame.freq, 0)
         self.assertListEqual(inst_data1.inst, [pulse.ShiftPhase(-1.57, pulse.DriveChannel(0))])
 
+    def test_load_instructions(self):
+        """Test loading instructions already bucketed for the channel."""
+        test_pulse = pulse.Gaussian(10, 0.1, 3)
+
+        sched = pulse.Schedule()
+        sched = sched.insert(0, pulse.SetPhase(3.14, pulse.DriveChannel(0)))
+        sched = sched.insert(0, pulse.Play(test_pulse, pulse.DriveChannel(0)))
+        sched = sched.insert(0, pulse.Play(test_pulse, pulse.DriveChannel(1)))
+        sched = sched.insert(10, pulse.Play(test_pulse, pulse.DriveChannel(0)))
+
+        instructions = sched.filter(channels=[pulse.DriveChannel(0)]).instructions
+        ch_events = events.ChannelEvents.load_instructions(instructions, pulse.DriveChannel(0))
+        ref_events = events.ChannelEvents.load_program(sched, pulse.DriveChannel(0))
+
+        self.assertListEqual(list(ch_events.get_waveforms()), list(ref_events.get_waveforms()))
+        self.assertListEqual(
+            list(ch_events.get_frame_changes()), list(ref_events.get_frame_changes())
+        )
+
     def test_multiple_frames_at_the_same_time(self):
         """Test multiple frame instruction at the same time."""
         # shift phase followed by set phase